@@ -1,8 +1,9 @@
 """Database connection and pool management."""
-import json
+import asyncio
 from typing import Optional
 
 import asyncpg
+import orjson
 import structlog
 
 from app.config import get_settings
@@ -10,62 +11,98 @@ from app.config import get_settings
 logger = structlog.get_logger()
 
 _pool: Optional[asyncpg.Pool] = None
+_pool_lock = asyncio.Lock()
+
+
+# Version header of the jsonb binary wire format (stable at 1).
+_JSONB_BINARY_VERSION = b'\x01'
+
+
+# orjson rejects asyncpg's own UUID type (e.g. ids copied from fetched rows),
+# so values it cannot encode natively fall back to their string form
+def _json_encode(value) -> str:
+    """Encode a value as JSON text using orjson."""
+    return orjson.dumps(value, default=str).decode()
+
+
+def _jsonb_encode(value) -> bytes:
+    """Encode a value in the jsonb binary wire format."""
+    return _JSONB_BINARY_VERSION + orjson.dumps(value, default=str)
+
+
+def _jsonb_decode(data: bytes):
+    """Decode a value from the jsonb binary wire format."""
+    return orjson.loads(memoryview(data)[1:])
 
 
 async def _init_connection(conn: asyncpg.Connection):
     """Initialize connection with JSON codec."""
     await conn.set_type_codec(
         'jsonb',
-        encoder=json.dumps,
-        decoder=json.loads,
-        schema='pg_catalog'
+        encoder=_jsonb_encode,
+        decoder=_jsonb_decode,
+        schema='pg_catalog',
+        format='binary'
     )
     await conn.set_type_codec(
         'json',
-        encoder=json.dumps,
-        decoder=json.loads,
+        encoder=_json_encode,
+        decoder=orjson.loads,
         schema='pg_catalog'
     )
 
 
 async def init_db() -> asyncpg.Pool:
-    """Initialize the database connection pool."""
+    """Initialize the database connection pool (once per process)."""
     global _pool
     settings = get_settings()
 
-    logger.info("Initializing database connection pool")
+    async with _pool_lock:
+        if _pool is not None:
+            return _pool
 
-    _pool = await asyncpg.create_pool(
-        dsn=settings.database_url,
-        min_size=5,
-        max_size=20,
-        command_timeout=60,
-        init=_init_connection,
-    )
+        logger.info(
+            "Initializing database connection pool",
+            min_size=settings.db_pool_min_size,
+            max_size=settings.db_pool_max_size,
+            statement_cache_size=settings.db_statement_cache_size,
+        )
 
-    logger.info("Database connection pool initialized")
-    return _pool
+        _pool = await asyncpg.create_pool(
+            dsn=settings.database_url,
+            min_size=settings.db_pool_min_size,
+            max_size=settings.db_pool_max_size,
+            max_inactive_connection_lifetime=settings.db_pool_max_inactive_lifetime,
+            statement_cache_size=settings.db_statement_cache_size,
+            max_cached_statement_lifetime=settings.db_statement_cache_lifetime,
+            command_timeout=60,
+            init=_init_connection,
+        )
+
+        logger.info("Database connection pool initialized")
+        return _pool
 
 
 async def close_db():
     """Close the database connection pool."""
     global _pool
-    if _pool:
-        logger.info("Closing database connection pool")
-        await _pool.close()
-        _pool = None
+    async with _pool_lock:
+        if _pool:
+            logger.info("Closing database connection pool")
+            await _pool.close()
+            _pool = None
 
 
 async def get_db_pool() -> asyncpg.Pool:
     """Get the database connection pool."""
-    global _pool
     if _pool is None:
-        _pool = await init_db()
+        return await init_db()
     return _pool
 
 
 async def get_db_connection():
     """Dependency to get a database connection."""
-    pool = await get_db_pool()
+    # The pool exists after startup; only fall back to init_db before that
+    pool = _pool or await init_db()
     async with pool.acquire() as connection:
         yield connection
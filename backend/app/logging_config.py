@@ -2,6 +2,7 @@
 import logging
 import sys
 
+import orjson
 import structlog
 
 from app.config import get_settings
@@ -11,6 +12,15 @@ def setup_logging():
     """Configure structured JSON logging."""
     settings = get_settings()
 
+    # JSON lines are rendered by orjson straight to bytes and written
+    # without a str round-trip; the console renderer still produces str
+    if settings.log_format == "json":
+        renderer = structlog.processors.JSONRenderer(serializer=orjson.dumps)
+        logger_factory = structlog.BytesLoggerFactory()
+    else:
+        renderer = structlog.dev.ConsoleRenderer()
+        logger_factory = structlog.PrintLoggerFactory()
+
     # Configure structlog
     structlog.configure(
         processors=[
@@ -19,14 +29,13 @@ def setup_logging():
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.JSONRenderer() if settings.log_format == "json"
-            else structlog.dev.ConsoleRenderer(),
+            renderer,
         ],
         wrapper_class=structlog.make_filtering_bound_logger(
             getattr(logging, settings.log_level.upper())
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
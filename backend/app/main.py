@@ -1,14 +1,21 @@
 """NGS (NoiseGate Service) - Main FastAPI Application."""
+import asyncio
+import os
 import time
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from fastapi.responses import JSONResponse, ORJSONResponse
+from prometheus_client import (
+    CollectorRegistry, Counter, Histogram, generate_latest, multiprocess, CONTENT_TYPE_LATEST
+)
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import get_settings
 from app.database import init_db, close_db
@@ -19,6 +26,11 @@ from app.routers import incidents, maintenance, admin, auth, quarantine, metrics
 setup_logging()
 logger = structlog.get_logger()
 
+# Set in the API image, which runs gunicorn workers (see gunicorn.conf.py);
+# metrics are then written to per-process files in this directory and
+# aggregated at scrape time
+PROMETHEUS_MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
 # Prometheus metrics
 REQUEST_COUNT = Counter(
     "ngs_http_requests_total",
@@ -32,23 +44,72 @@ REQUEST_LATENCY = Histogram(
 )
 
 
+class ObservabilityMiddleware:
+    """ASGI middleware that logs requests and tracks request metrics."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        request_id = Headers(scope=scope).get("X-Request-ID", "")
+
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(
+            request_id=request_id,
+            method=method,
+            path=scope["path"],
+        )
+
+        logger.info("Request started")
+
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            logger.exception("Request failed", error=str(e))
+            raise
+        finally:
+            duration = time.perf_counter() - start_time
+
+            # Use the matched route template to keep label cardinality bounded
+            route = scope.get("route")
+            endpoint = getattr(route, "path", "unknown")
+
+            REQUEST_COUNT.labels(method, endpoint, status_code).inc()
+            REQUEST_LATENCY.labels(method, endpoint).observe(duration)
+
+        logger.info("Request completed", status_code=status_code)
+
+
 async def seed_admin_user():
     """Ensure default admin user exists."""
-    from passlib.context import CryptContext
     from app.database import get_db_pool
+    from app.routers.auth import hash_password, is_usable_hash, verify_password
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     pool = await get_db_pool()
 
     async with pool.acquire() as conn:
         # Check if admin exists
         existing = await conn.fetchrow(
-            "SELECT id FROM users WHERE username = 'admin'"
+            "SELECT id, email, password_hash FROM users WHERE username = 'admin'"
         )
 
         if not existing:
             # Create admin user with password "admin123"
-            password_hash = pwd_context.hash("admin123")
+            password_hash = hash_password("admin123")
             await conn.execute(
                 """
                 INSERT INTO users (username, email, password_hash, display_name, role)
@@ -58,9 +119,15 @@ async def seed_admin_user():
                 password_hash
             )
             logger.info("Created default admin user (admin/admin123)")
-        else:
-            # Update password hash and fix email if needed
-            password_hash = pwd_context.hash("admin123")
+        elif not is_usable_hash(existing["password_hash"]) or (
+            settings.reset_admin_password and (
+                existing["email"] != "admin@example.com"
+                or not verify_password("admin123", existing["password_hash"])
+            )
+        ):
+            # The migration seeds the admin row with a placeholder hash that
+            # must always be replaced; a real password is only reset on request
+            password_hash = hash_password("admin123")
             await conn.execute(
                 "UPDATE users SET password_hash = $1, email = 'admin@example.com' WHERE username = 'admin'",
                 password_hash
@@ -74,8 +141,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     logger.info("Starting NGS API server")
     await init_db()
     await seed_admin_user()
+    gauge_refresher = asyncio.create_task(metrics.run_state_gauge_refresher())
     yield
     logger.info("Shutting down NGS API server")
+    gauge_refresher.cancel()
+    with suppress(asyncio.CancelledError):
+        await gauge_refresher
     await close_db()
 
 
@@ -85,6 +156,7 @@ app = FastAPI(
     description="Enterprise-grade alert noise reduction and incident correlation platform",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -98,53 +170,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-
-
-@app.middleware("http")
-async def metrics_middleware(request: Request, call_next):
-    """Middleware to track request metrics."""
-    start_time = time.time()
-    response = await call_next(request)
-    duration = time.time() - start_time
-
-    # Extract endpoint pattern (simplified)
-    endpoint = request.url.path
-
-    REQUEST_COUNT.labels(
-        method=request.method,
-        endpoint=endpoint,
-        status=response.status_code
-    ).inc()
-
-    REQUEST_LATENCY.labels(
-        method=request.method,
-        endpoint=endpoint
-    ).observe(duration)
-
-    return response
-
-
-@app.middleware("http")
-async def logging_middleware(request: Request, call_next):
-    """Middleware to log requests."""
-    request_id = request.headers.get("X-Request-ID", "")
-
-    structlog.contextvars.clear_contextvars()
-    structlog.contextvars.bind_contextvars(
-        request_id=request_id,
-        method=request.method,
-        path=request.url.path,
-    )
-
-    logger.info("Request started")
-
-    try:
-        response = await call_next(request)
-        logger.info("Request completed", status_code=response.status_code)
-        return response
-    except Exception as e:
-        logger.exception("Request failed", error=str(e))
-        raise
+app.add_middleware(ObservabilityMiddleware)
 
 
 # Include routers
@@ -161,14 +187,26 @@ async def health_check():
     return {"status": "healthy", "service": "ngs-api", "version": "0.1.0"}
 
 
+READY_CACHE_SECONDS = 1.0
+READY_ACQUIRE_TIMEOUT_SECONDS = 0.5
+_last_ready_at = 0.0
+
+
 @app.get("/readyz", tags=["Health"])
 async def readiness_check():
     """Readiness check endpoint."""
+    global _last_ready_at
     from app.database import get_db_pool
+
+    # Recent successful checks are reused; failures are always re-checked
+    if time.monotonic() - _last_ready_at < READY_CACHE_SECONDS:
+        return {"status": "ready", "database": "connected"}
+
     pool = await get_db_pool()
     try:
-        async with pool.acquire() as conn:
+        async with pool.acquire(timeout=READY_ACQUIRE_TIMEOUT_SECONDS) as conn:
             await conn.fetchval("SELECT 1")
+        _last_ready_at = time.monotonic()
         return {"status": "ready", "database": "connected"}
     except Exception as e:
         return JSONResponse(
@@ -177,11 +215,22 @@ async def readiness_check():
         )
 
 
+def _render_metrics() -> bytes:
+    """Render all metrics, merging every worker's files in multiprocess mode."""
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
+
+
 @app.get("/metrics", tags=["Metrics"])
 async def prometheus_metrics():
     """Prometheus metrics endpoint."""
+    # Rendering every metric family is CPU-bound; keep it off the event loop
+    content = await run_in_threadpool(_render_metrics)
     return Response(
-        content=generate_latest(),
+        content=content,
         media_type=CONTENT_TYPE_LATEST
     )
 
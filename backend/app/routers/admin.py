@@ -1,30 +1,64 @@
 """Admin router for configuration and system management."""
 import hashlib
-from typing import Any, Dict, List
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Union
 
+import orjson
 import structlog
 import yaml
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.responses import Response
 
-from app.database import get_db_connection
-from app.routers.auth import get_current_user
-from app.services.audit import log_audit
+from app.database import get_db_connection, get_db_pool
+from app.routers.auth import OPERATOR_ROLES, get_current_user
+from app.services.cache import ttl_cache
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Dashboards poll the stats endpoints far more often than the data changes
+STATS_CACHE_TTL_SECONDS = 3.0
+
+CONFIG_TYPES = frozenset({"parsers", "correlation", "maintenance"})
+
+# Longest window allowed per timeline granularity, in days
+TIMELINE_MAX_DAYS = {"hour": 7, "day": 90, "week": 365}
+
+
+def _json_response(payload: Union[str, bytes]) -> Response:
+    """Return an already-encoded JSON document without re-encoding it."""
+    return Response(content=payload, media_type="application/json")
+
+
+@lru_cache(maxsize=16)
+def _load_yaml_config(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML config file, memoized per path, mtime and size."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _read_config(path: str) -> dict:
+    """Read a config file, re-parsing it only when it changes on disk."""
+    try:
+        st = os.stat(path)
+        config = _load_yaml_config(path, st.st_mtime_ns, st.st_size)
+        return {"config": config, "source": "file"}
+    except FileNotFoundError:
+        return {"config": {}, "source": "default", "message": "No custom config found"}
+
 
 @router.get("/config/parsers")
 async def get_parser_config(
     current_user: dict = Depends(get_current_user)
 ):
     """Get current parser configuration."""
-    try:
-        with open("/app/configs/parsers.yml", "r") as f:
-            config = yaml.safe_load(f)
-        return {"config": config, "source": "file"}
-    except FileNotFoundError:
-        return {"config": {}, "source": "default", "message": "No custom config found"}
+    return _read_config("/app/configs/parsers.yml")
 
 
 @router.get("/config/correlation")
@@ -32,12 +66,7 @@ async def get_correlation_config(
     current_user: dict = Depends(get_current_user)
 ):
     """Get current correlation configuration."""
-    try:
-        with open("/app/configs/correlation.yml", "r") as f:
-            config = yaml.safe_load(f)
-        return {"config": config, "source": "file"}
-    except FileNotFoundError:
-        return {"config": {}, "source": "default", "message": "No custom config found"}
+    return _read_config("/app/configs/correlation.yml")
 
 
 @router.get("/config/maintenance")
@@ -45,12 +74,7 @@ async def get_maintenance_config(
     current_user: dict = Depends(get_current_user)
 ):
     """Get current maintenance detection configuration."""
-    try:
-        with open("/app/configs/maintenance.yml", "r") as f:
-            config = yaml.safe_load(f)
-        return {"config": config, "source": "file"}
-    except FileNotFoundError:
-        return {"config": {}, "source": "default", "message": "No custom config found"}
+    return _read_config("/app/configs/maintenance.yml")
 
 
 @router.post("/config/upload")
@@ -64,20 +88,23 @@ async def upload_config(
     if current_user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Only admins can upload configs")
 
-    if config_type not in ("parsers", "correlation", "maintenance"):
+    if config_type not in CONFIG_TYPES:
         raise HTTPException(status_code=400, detail="Invalid config type")
 
+    # Hash the spooled upload in C, then rewind to read the content
+    checksum = hashlib.file_digest(file.file, "sha256").hexdigest()
+    await file.seek(0)
     content = await file.read()
     content_str = content.decode("utf-8")
 
-    # Validate YAML
+    # Validate YAML syntax by draining parser events; no Python objects are built
     try:
-        yaml.safe_load(content_str)
+        for _ in yaml.parse(content_str, Loader=SafeLoader):
+            pass
     except yaml.YAMLError as e:
         raise HTTPException(status_code=400, detail=f"Invalid YAML: {str(e)}")
 
     # Store snapshot in database for audit
-    checksum = hashlib.sha256(content).hexdigest()
     await conn.execute(
         """
         INSERT INTO config_snapshots (config_type, config_name, content, checksum, uploaded_by)
@@ -86,6 +113,8 @@ async def upload_config(
         config_type, file.filename, content_str, checksum, current_user["id"]
     )
 
+    _load_yaml_config.cache_clear()
+
     # In production, this would write to shared storage or trigger config reload
     logger.info("Config uploaded", type=config_type, by=current_user["username"], checksum=checksum)
 
@@ -121,36 +150,66 @@ async def get_ingestion_status(
     current_user: dict = Depends(get_current_user)
 ):
     """Get ingestion status for all folders."""
-    cursors = await conn.fetch(
+    payload = await conn.fetchval(
         """
-        SELECT folder, last_uid, last_poll_at, last_success_at,
-               last_error, error_count, emails_processed, updated_at
-        FROM folder_cursors
-        ORDER BY folder
+        WITH email_stats AS (
+            SELECT folder, COUNT(*) as total,
+                   COUNT(*) FILTER (WHERE parse_status = 'success') as parsed,
+                   COUNT(*) FILTER (WHERE parse_status IN ('failed', 'quarantine')) as failed,
+                   MAX(received_at) as latest_email
+            FROM raw_emails
+            GROUP BY folder
+        )
+        SELECT json_build_object(
+            'folders', COALESCE(json_agg(t ORDER BY t.folder), '[]'::json)
+        )::text
+        FROM (
+            SELECT fc.folder, fc.last_uid, fc.last_poll_at, fc.last_success_at,
+                   fc.last_error, fc.error_count, fc.emails_processed, fc.updated_at,
+                   COALESCE(row_to_json(es), '{}'::json) as email_stats
+            FROM folder_cursors fc
+            LEFT JOIN email_stats es ON es.folder = fc.folder
+        ) t
         """
     )
 
-    # Get recent email counts
-    email_stats = await conn.fetch(
-        """
-        SELECT folder, COUNT(*) as total,
-               COUNT(*) FILTER (WHERE parse_status = 'success') as parsed,
-               COUNT(*) FILTER (WHERE parse_status IN ('failed', 'quarantine')) as failed,
-               MAX(received_at) as latest_email
-        FROM raw_emails
-        GROUP BY folder
-        """
-    )
+    return _json_response(payload)
+
 
-    email_stats_map = {s["folder"]: dict(s) for s in email_stats}
+@lru_cache(maxsize=8)
+def _audit_log_sql(has_entity_type: bool, has_entity_id: bool, has_action: bool) -> str:
+    """Build the audit log query for a given combination of filters.
 
-    result = []
-    for cursor in cursors:
-        cursor_dict = dict(cursor)
-        cursor_dict["email_stats"] = email_stats_map.get(cursor["folder"], {})
-        result.append(cursor_dict)
+    The query text is stable per filter shape so asyncpg's statement cache
+    can reuse the prepared plan.
+    """
+    conditions = []
+    param_idx = 1
+
+    for column, enabled in (
+        ("entity_type", has_entity_type),
+        ("entity_id", has_entity_id),
+        ("action", has_action),
+    ):
+        if enabled:
+            conditions.append(f"{column} = ${param_idx}")
+            param_idx += 1
+
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
 
-    return {"folders": result}
+    return f"""
+        SELECT json_build_object(
+            'entries', COALESCE(json_agg(t ORDER BY t.created_at DESC), '[]'::json)
+        )::text
+        FROM (
+            SELECT al.*, u.username
+            FROM audit_log al
+            LEFT JOIN users u ON u.id = al.user_id
+            WHERE {where_clause}
+            ORDER BY al.created_at DESC
+            LIMIT ${param_idx}
+        ) t
+        """
 
 
 @router.get("/audit-log")
@@ -163,142 +222,202 @@ async def get_audit_log(
     current_user: dict = Depends(get_current_user)
 ):
     """Get audit log entries."""
-    if current_user["role"] not in ("operator", "admin"):
+    if current_user["role"] not in OPERATOR_ROLES:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    conditions = []
-    params = []
-    param_idx = 1
-
-    if entity_type:
-        conditions.append(f"entity_type = ${param_idx}")
-        params.append(entity_type)
-        param_idx += 1
-
-    if entity_id:
-        conditions.append(f"entity_id = ${param_idx}")
-        params.append(entity_id)
-        param_idx += 1
+    params = [p for p in (entity_type, entity_id, action) if p]
 
-    if action:
-        conditions.append(f"action = ${param_idx}")
-        params.append(action)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-    logs = await conn.fetch(
-        f"""
-        SELECT al.*, u.username
-        FROM audit_log al
-        LEFT JOIN users u ON u.id = al.user_id
-        WHERE {where_clause}
-        ORDER BY al.created_at DESC
-        LIMIT ${param_idx}
-        """,
+    payload = await conn.fetchval(
+        _audit_log_sql(bool(entity_type), bool(entity_id), bool(action)),
         *params, limit
     )
 
-    return {"entries": [dict(log) for log in logs]}
+    return _json_response(payload)
+
+
+@ttl_cache(STATS_CACHE_TTL_SECONDS)
+async def _system_stats() -> str:
+    """Compute system-wide statistics as a JSON document."""
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        return await conn.fetchval(
+            """
+            SELECT json_build_object(
+                'incidents', (
+                    SELECT json_build_object(
+                        'total', COUNT(*),
+                        'open', COUNT(*) FILTER (WHERE status = 'open'),
+                        'acknowledged', COUNT(*) FILTER (WHERE status = 'acknowledged'),
+                        'resolved', COUNT(*) FILTER (WHERE status = 'resolved'),
+                        'suppressed', COUNT(*) FILTER (WHERE status = 'suppressed'),
+                        'in_maintenance', COUNT(*) FILTER (WHERE is_in_maintenance)
+                    )
+                    FROM incidents
+                ),
+                'emails', (
+                    SELECT json_build_object(
+                        'total', COUNT(*),
+                        'parsed', COUNT(*) FILTER (WHERE parse_status = 'success'),
+                        'quarantined', COUNT(*) FILTER (WHERE parse_status IN ('failed', 'quarantine'))
+                    )
+                    FROM raw_emails
+                ),
+                'maintenance_windows', (
+                    SELECT json_build_object(
+                        'total', COUNT(*),
+                        'currently_active', COUNT(*) FILTER (
+                            WHERE is_active AND start_ts <= NOW() AND end_ts >= NOW()
+                        )
+                    )
+                    FROM maintenance_windows
+                ),
+                'last_24h', json_build_object(
+                    'new_incidents', (
+                        SELECT COUNT(*) FROM incidents
+                        WHERE created_at > NOW() - INTERVAL '24 hours'
+                    ),
+                    'new_events', (
+                        SELECT COUNT(*) FROM alert_events
+                        WHERE created_at > NOW() - INTERVAL '24 hours'
+                    )
+                )
+            )::text
+            """
+        )
 
 
 @router.get("/stats/overview")
 async def get_system_stats(
-    conn=Depends(get_db_connection),
     current_user: dict = Depends(get_current_user)
 ):
     """Get system-wide statistics."""
-    stats = {}
-
-    # Incident stats
-    incident_stats = await conn.fetchrow(
-        """
-        SELECT
-            COUNT(*) as total,
-            COUNT(*) FILTER (WHERE status = 'open') as open,
-            COUNT(*) FILTER (WHERE status = 'acknowledged') as acknowledged,
-            COUNT(*) FILTER (WHERE status = 'resolved') as resolved,
-            COUNT(*) FILTER (WHERE status = 'suppressed') as suppressed,
-            COUNT(*) FILTER (WHERE is_in_maintenance) as in_maintenance
-        FROM incidents
-        """
-    )
-    stats["incidents"] = dict(incident_stats)
-
-    # Email stats
-    email_stats = await conn.fetchrow(
-        """
-        SELECT
-            COUNT(*) as total,
-            COUNT(*) FILTER (WHERE parse_status = 'success') as parsed,
-            COUNT(*) FILTER (WHERE parse_status IN ('failed', 'quarantine')) as quarantined
-        FROM raw_emails
-        """
-    )
-    stats["emails"] = dict(email_stats)
-
-    # Maintenance window stats
-    mw_stats = await conn.fetchrow(
-        """
-        SELECT
-            COUNT(*) as total,
-            COUNT(*) FILTER (WHERE is_active AND start_ts <= NOW() AND end_ts >= NOW()) as currently_active
-        FROM maintenance_windows
-        """
-    )
-    stats["maintenance_windows"] = dict(mw_stats)
-
-    # Recent activity
-    recent_incidents = await conn.fetchval(
-        "SELECT COUNT(*) FROM incidents WHERE created_at > NOW() - INTERVAL '24 hours'"
-    )
-    recent_events = await conn.fetchval(
-        "SELECT COUNT(*) FROM alert_events WHERE created_at > NOW() - INTERVAL '24 hours'"
-    )
-    stats["last_24h"] = {
-        "new_incidents": recent_incidents,
-        "new_events": recent_events
-    }
-
-    return stats
+    return _json_response(await _system_stats())
+
+
+@ttl_cache(STATS_CACHE_TTL_SECONDS)
+async def _severity_breakdown() -> str:
+    """Compute incident breakdown by severity as a JSON document."""
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        return await conn.fetchval(
+            """
+            SELECT json_build_object(
+                'breakdown', COALESCE(json_agg(t ORDER BY t.severity, t.status), '[]'::json)
+            )::text
+            FROM (
+                SELECT severity, status, COUNT(*) as count
+                FROM incidents
+                GROUP BY severity, status
+            ) t
+            """
+        )
 
 
 @router.get("/stats/severity")
 async def get_severity_breakdown(
-    conn=Depends(get_db_connection),
     current_user: dict = Depends(get_current_user)
 ):
     """Get incident breakdown by severity."""
-    stats = await conn.fetch(
-        """
-        SELECT severity, status, COUNT(*) as count
-        FROM incidents
-        GROUP BY severity, status
-        ORDER BY severity, status
-        """
-    )
-
-    return {"breakdown": [dict(s) for s in stats]}
+    return _json_response(await _severity_breakdown())
+
+
+@ttl_cache(STATS_CACHE_TTL_SECONDS)
+async def _source_breakdown() -> str:
+    """Compute incident breakdown by source tool as a JSON document."""
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        return await conn.fetchval(
+            """
+            SELECT json_build_object(
+                'sources', COALESCE(json_agg(t ORDER BY t.total DESC), '[]'::json)
+            )::text
+            FROM (
+                SELECT source_tool, COUNT(*) as total,
+                       COUNT(*) FILTER (WHERE status = 'open') as open
+                FROM incidents
+                WHERE source_tool IS NOT NULL
+                GROUP BY source_tool
+            ) t
+            """
+        )
 
 
 @router.get("/stats/sources")
 async def get_source_breakdown(
-    conn=Depends(get_db_connection),
     current_user: dict = Depends(get_current_user)
 ):
     """Get incident breakdown by source tool."""
-    stats = await conn.fetch(
-        """
-        SELECT source_tool, COUNT(*) as total,
-               COUNT(*) FILTER (WHERE status = 'open') as open
-        FROM incidents
-        WHERE source_tool IS NOT NULL
-        GROUP BY source_tool
-        ORDER BY total DESC
-        """
-    )
-
-    return {"sources": [dict(s) for s in stats]}
+    return _json_response(await _source_breakdown())
+
+
+# All three timeline series are assembled into one JSON document by Postgres.
+# $1 is the date_trunc unit and $2 the window in days.
+_TIMELINE_SQL = """
+    SELECT json_build_object(
+        -- Incidents over time (from the hourly rollup)
+        'incidents', (
+            SELECT COALESCE(json_agg(json_build_object(
+                'period', t.period,
+                'total', t.total,
+                'critical', t.critical,
+                'high', t.high,
+                'medium', t.medium,
+                'low', t.low,
+                'info', t.info
+            ) ORDER BY t.period), '[]'::json)
+            FROM (
+                SELECT
+                    date_trunc($1, bucket) as period,
+                    SUM(incident_count)::bigint as total,
+                    COALESCE(SUM(incident_count) FILTER (WHERE severity = 'critical'), 0)::bigint as critical,
+                    COALESCE(SUM(incident_count) FILTER (WHERE severity = 'high'), 0)::bigint as high,
+                    COALESCE(SUM(incident_count) FILTER (WHERE severity = 'medium'), 0)::bigint as medium,
+                    COALESCE(SUM(incident_count) FILTER (WHERE severity = 'low'), 0)::bigint as low,
+                    COALESCE(SUM(incident_count) FILTER (WHERE severity = 'info'), 0)::bigint as info
+                FROM incident_rollup_hourly
+                WHERE bucket >= date_trunc('hour', NOW() - INTERVAL '1 day' * $2)
+                GROUP BY period
+            ) t
+        ),
+        -- Events over time
+        'events', (
+            SELECT COALESCE(json_agg(json_build_object(
+                'period', t.period,
+                'total', t.total,
+                'unique_incidents', t.unique_incidents
+            ) ORDER BY t.period), '[]'::json)
+            FROM (
+                SELECT
+                    date_trunc($1, occurred_at) as period,
+                    COUNT(*) as total,
+                    COUNT(DISTINCT incident_events.incident_id) as unique_incidents
+                FROM alert_events
+                LEFT JOIN incident_events ON alert_events.id = incident_events.alert_event_id
+                WHERE occurred_at >= NOW() - INTERVAL '1 day' * $2
+                GROUP BY period
+            ) t
+        ),
+        -- Resolution time stats (from the hourly resolution rollup)
+        'resolution', (
+            SELECT COALESCE(json_agg(json_build_object(
+                'period', t.period,
+                'avg_minutes', ROUND(NULLIF(t.avg_resolution_minutes, 0), 1),
+                'count', t.resolved_count
+            ) ORDER BY t.period), '[]'::json)
+            FROM (
+                SELECT
+                    date_trunc($1, bucket) as period,
+                    SUM(total_resolution_minutes) / SUM(resolved_count) as avg_resolution_minutes,
+                    SUM(resolved_count)::bigint as resolved_count
+                FROM incident_resolution_rollup_hourly
+                WHERE bucket >= date_trunc('hour', NOW() - INTERVAL '1 day' * $2)
+                GROUP BY period
+            ) t
+        ),
+        'granularity', $1::text,
+        'days', $2::int
+    )::text
+"""
 
 
 @router.get("/stats/timeline")
@@ -309,100 +428,14 @@ async def get_timeline_stats(
     current_user: dict = Depends(get_current_user)
 ):
     """Get incident timeline statistics for charts."""
-    if granularity not in ("hour", "day", "week"):
+    if granularity not in TIMELINE_MAX_DAYS:
         granularity = "day"
 
-    # Determine the date truncation and interval
-    if granularity == "hour":
-        date_trunc = "hour"
-        max_days = min(days, 7)  # Limit to 7 days for hourly
-    elif granularity == "week":
-        date_trunc = "week"
-        max_days = min(days, 365)
-    else:
-        date_trunc = "day"
-        max_days = min(days, 90)
-
-    # Incidents over time
-    incidents_timeline = await conn.fetch(
-        f"""
-        SELECT
-            date_trunc('{date_trunc}', created_at) as period,
-            COUNT(*) as total,
-            COUNT(*) FILTER (WHERE severity = 'critical') as critical,
-            COUNT(*) FILTER (WHERE severity = 'high') as high,
-            COUNT(*) FILTER (WHERE severity = 'medium') as medium,
-            COUNT(*) FILTER (WHERE severity = 'low') as low,
-            COUNT(*) FILTER (WHERE severity = 'info') as info
-        FROM incidents
-        WHERE created_at >= NOW() - INTERVAL '{max_days} days'
-        GROUP BY date_trunc('{date_trunc}', created_at)
-        ORDER BY period
-        """
-    )
+    max_days = min(days, TIMELINE_MAX_DAYS[granularity])
 
-    # Events over time
-    events_timeline = await conn.fetch(
-        f"""
-        SELECT
-            date_trunc('{date_trunc}', occurred_at) as period,
-            COUNT(*) as total,
-            COUNT(DISTINCT incident_events.incident_id) as unique_incidents
-        FROM alert_events
-        LEFT JOIN incident_events ON alert_events.id = incident_events.alert_event_id
-        WHERE occurred_at >= NOW() - INTERVAL '{max_days} days'
-        GROUP BY date_trunc('{date_trunc}', occurred_at)
-        ORDER BY period
-        """
-    )
+    payload = await conn.fetchval(_TIMELINE_SQL, granularity, max_days)
 
-    # Resolution time stats
-    resolution_stats = await conn.fetch(
-        f"""
-        SELECT
-            date_trunc('{date_trunc}', resolved_at) as period,
-            AVG(EXTRACT(EPOCH FROM (resolved_at - first_seen_at)) / 60) as avg_resolution_minutes,
-            COUNT(*) as resolved_count
-        FROM incidents
-        WHERE resolved_at IS NOT NULL
-          AND resolved_at >= NOW() - INTERVAL '{max_days} days'
-        GROUP BY date_trunc('{date_trunc}', resolved_at)
-        ORDER BY period
-        """
-    )
-
-    return {
-        "incidents": [
-            {
-                "period": row["period"].isoformat() if row["period"] else None,
-                "total": row["total"],
-                "critical": row["critical"],
-                "high": row["high"],
-                "medium": row["medium"],
-                "low": row["low"],
-                "info": row["info"]
-            }
-            for row in incidents_timeline
-        ],
-        "events": [
-            {
-                "period": row["period"].isoformat() if row["period"] else None,
-                "total": row["total"],
-                "unique_incidents": row["unique_incidents"]
-            }
-            for row in events_timeline
-        ],
-        "resolution": [
-            {
-                "period": row["period"].isoformat() if row["period"] else None,
-                "avg_minutes": round(row["avg_resolution_minutes"], 1) if row["avg_resolution_minutes"] else None,
-                "count": row["resolved_count"]
-            }
-            for row in resolution_stats
-        ],
-        "granularity": granularity,
-        "days": max_days
-    }
+    return _json_response(payload)
 
 
 @router.get("/stats/top-hosts")
@@ -416,14 +449,14 @@ async def get_top_hosts(
     stats = await conn.fetch(
         """
         SELECT
-            COALESCE(host, '(no host)') as host,
-            COUNT(*) as incident_count,
-            COUNT(*) FILTER (WHERE status = 'open') as open_count,
-            COUNT(*) FILTER (WHERE severity IN ('critical', 'high')) as critical_high_count,
+            host_key as host,
+            SUM(incident_count)::bigint as incident_count,
+            COALESCE(SUM(incident_count) FILTER (WHERE status = 'open'), 0)::bigint as open_count,
+            COALESCE(SUM(incident_count) FILTER (WHERE severity IN ('critical', 'high')), 0)::bigint as critical_high_count,
             MAX(last_seen_at) as last_incident
-        FROM incidents
-        WHERE created_at >= NOW() - INTERVAL '1 day' * $1
-        GROUP BY COALESCE(host, '(no host)')
+        FROM incident_rollup_hourly
+        WHERE bucket >= date_trunc('hour', NOW() - INTERVAL '1 day' * $1)
+        GROUP BY host_key
         ORDER BY incident_count DESC
         LIMIT $2
         """,
@@ -437,7 +470,7 @@ async def get_top_hosts(
                 "incident_count": row["incident_count"],
                 "open_count": row["open_count"],
                 "critical_high_count": row["critical_high_count"],
-                "last_incident": row["last_incident"].isoformat() if row["last_incident"] else None
+                "last_incident": row["last_incident"]
             }
             for row in stats
         ],
@@ -456,15 +489,15 @@ async def get_top_services(
     stats = await conn.fetch(
         """
         SELECT
-            COALESCE(check_name, service, '(unknown)') as service,
+            service_key as service,
             source_tool,
-            COUNT(*) as incident_count,
-            COUNT(*) FILTER (WHERE status = 'open') as open_count,
+            SUM(incident_count)::bigint as incident_count,
+            COALESCE(SUM(incident_count) FILTER (WHERE status = 'open'), 0)::bigint as open_count,
             COUNT(DISTINCT host) as affected_hosts,
             MAX(last_seen_at) as last_incident
-        FROM incidents
-        WHERE created_at >= NOW() - INTERVAL '1 day' * $1
-        GROUP BY COALESCE(check_name, service, '(unknown)'), source_tool
+        FROM incident_rollup_hourly
+        WHERE bucket >= date_trunc('hour', NOW() - INTERVAL '1 day' * $1)
+        GROUP BY service_key, source_tool
         ORDER BY incident_count DESC
         LIMIT $2
         """,
@@ -479,7 +512,7 @@ async def get_top_services(
                 "incident_count": row["incident_count"],
                 "open_count": row["open_count"],
                 "affected_hosts": row["affected_hosts"],
-                "last_incident": row["last_incident"].isoformat() if row["last_incident"] else None
+                "last_incident": row["last_incident"]
             }
             for row in stats
         ],
@@ -487,6 +520,72 @@ async def get_top_services(
     }
 
 
+# MTTR overall (percentiles need the base table) and by severity / source
+# (from the resolution rollup), as one JSON document. $1 is the window in days.
+_MTTR_SQL = """
+    WITH resolved AS (
+        SELECT EXTRACT(EPOCH FROM (resolved_at - first_seen_at)) / 60 AS minutes
+        FROM incidents
+        WHERE resolved_at IS NOT NULL
+          AND resolved_at >= NOW() - INTERVAL '1 day' * $1
+    )
+    SELECT json_build_object(
+        'overall', (
+            SELECT json_build_object(
+                'avg_minutes', ROUND(NULLIF(AVG(minutes), 0)::numeric, 1),
+                'median_minutes', ROUND(NULLIF(PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY minutes), 0)::numeric, 1),
+                'p95_minutes', ROUND(NULLIF(PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY minutes), 0)::numeric, 1),
+                'min_minutes', ROUND(NULLIF(MIN(minutes), 0)::numeric, 1),
+                'max_minutes', ROUND(NULLIF(MAX(minutes), 0)::numeric, 1),
+                'resolved_count', COUNT(*)
+            )
+            FROM resolved
+        ),
+        'by_severity', (
+            SELECT COALESCE(json_agg(json_build_object(
+                'severity', t.severity,
+                'avg_minutes', ROUND(NULLIF(t.avg_minutes, 0), 1),
+                'count', t.count
+            ) ORDER BY
+                CASE t.severity
+                    WHEN 'critical' THEN 1
+                    WHEN 'high' THEN 2
+                    WHEN 'medium' THEN 3
+                    WHEN 'low' THEN 4
+                    ELSE 5
+                END
+            ), '[]'::json)
+            FROM (
+                SELECT
+                    severity,
+                    SUM(total_resolution_minutes) / SUM(resolved_count) as avg_minutes,
+                    SUM(resolved_count)::bigint as count
+                FROM incident_resolution_rollup_hourly
+                WHERE bucket >= date_trunc('hour', NOW() - INTERVAL '1 day' * $1)
+                GROUP BY severity
+            ) t
+        ),
+        'by_source', (
+            SELECT COALESCE(json_agg(json_build_object(
+                'source', t.source,
+                'avg_minutes', ROUND(NULLIF(t.avg_minutes, 0), 1),
+                'count', t.count
+            ) ORDER BY t.count DESC), '[]'::json)
+            FROM (
+                SELECT
+                    COALESCE(source_tool, 'unknown') as source,
+                    SUM(total_resolution_minutes) / SUM(resolved_count) as avg_minutes,
+                    SUM(resolved_count)::bigint as count
+                FROM incident_resolution_rollup_hourly
+                WHERE bucket >= date_trunc('hour', NOW() - INTERVAL '1 day' * $1)
+                GROUP BY COALESCE(source_tool, 'unknown')
+            ) t
+        ),
+        'days', $1::int
+    )::text
+"""
+
+
 @router.get("/stats/mttr")
 async def get_mttr_stats(
     days: int = 30,
@@ -494,81 +593,62 @@ async def get_mttr_stats(
     current_user: dict = Depends(get_current_user)
 ):
     """Get Mean Time To Resolution (MTTR) statistics."""
-    # Overall MTTR
-    overall = await conn.fetchrow(
-        """
-        SELECT
-            AVG(EXTRACT(EPOCH FROM (resolved_at - first_seen_at)) / 60) as avg_minutes,
-            PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY EXTRACT(EPOCH FROM (resolved_at - first_seen_at)) / 60) as median_minutes,
-            PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY EXTRACT(EPOCH FROM (resolved_at - first_seen_at)) / 60) as p95_minutes,
-            MIN(EXTRACT(EPOCH FROM (resolved_at - first_seen_at)) / 60) as min_minutes,
-            MAX(EXTRACT(EPOCH FROM (resolved_at - first_seen_at)) / 60) as max_minutes,
-            COUNT(*) as resolved_count
-        FROM incidents
-        WHERE resolved_at IS NOT NULL
-          AND resolved_at >= NOW() - INTERVAL '1 day' * $1
-        """,
-        days
-    )
+    return _json_response(await conn.fetchval(_MTTR_SQL, days))
 
-    # MTTR by severity
-    by_severity = await conn.fetch(
-        """
-        SELECT
-            severity,
-            AVG(EXTRACT(EPOCH FROM (resolved_at - first_seen_at)) / 60) as avg_minutes,
-            COUNT(*) as count
-        FROM incidents
-        WHERE resolved_at IS NOT NULL
-          AND resolved_at >= NOW() - INTERVAL '1 day' * $1
-        GROUP BY severity
-        ORDER BY
-            CASE severity
-                WHEN 'critical' THEN 1
-                WHEN 'high' THEN 2
-                WHEN 'medium' THEN 3
-                WHEN 'low' THEN 4
-                ELSE 5
-            END
-        """,
-        days
-    )
 
-    # MTTR by source
-    by_source = await conn.fetch(
-        """
-        SELECT
-            COALESCE(source_tool, 'unknown') as source,
-            AVG(EXTRACT(EPOCH FROM (resolved_at - first_seen_at)) / 60) as avg_minutes,
-            COUNT(*) as count
-        FROM incidents
-        WHERE resolved_at IS NOT NULL
-          AND resolved_at >= NOW() - INTERVAL '1 day' * $1
-        GROUP BY COALESCE(source_tool, 'unknown')
-        ORDER BY count DESC
-        """,
-        days
-    )
+_SEARCH_COLUMNS = """
+    id, fingerprint, title, source_tool, host, check_name, service,
+    severity, status, first_seen_at, last_seen_at, event_count,
+    is_in_maintenance
+"""
 
-    return {
-        "overall": {
-            "avg_minutes": round(overall["avg_minutes"], 1) if overall["avg_minutes"] else None,
-            "median_minutes": round(overall["median_minutes"], 1) if overall["median_minutes"] else None,
-            "p95_minutes": round(overall["p95_minutes"], 1) if overall["p95_minutes"] else None,
-            "min_minutes": round(overall["min_minutes"], 1) if overall["min_minutes"] else None,
-            "max_minutes": round(overall["max_minutes"], 1) if overall["max_minutes"] else None,
-            "resolved_count": overall["resolved_count"]
-        },
-        "by_severity": [
-            {"severity": row["severity"], "avg_minutes": round(row["avg_minutes"], 1) if row["avg_minutes"] else None, "count": row["count"]}
-            for row in by_severity
-        ],
-        "by_source": [
-            {"source": row["source"], "avg_minutes": round(row["avg_minutes"], 1) if row["avg_minutes"] else None, "count": row["count"]}
-            for row in by_source
-        ],
-        "days": days
-    }
+
+@lru_cache(maxsize=16)
+def _search_sql(has_q: bool, has_status: bool, has_severity: bool, has_source: bool) -> str:
+    """Build the incident search query for a given combination of filters.
+
+    $1 is the day window; filter parameters follow in argument order and
+    the limit is always last.
+    """
+    conditions = ["created_at >= NOW() - INTERVAL '1 day' * $1"]
+    param_idx = 2
+
+    # Text search
+    if has_q:
+        conditions.append(
+            f"(search_tsv @@ plainto_tsquery('simple', ${param_idx})"
+            f" OR search_text ILIKE ${param_idx + 1})"
+        )
+        param_idx += 2
+
+    for column, enabled in (
+        ("status", has_status),
+        ("severity", has_severity),
+        ("source_tool", has_source),
+    ):
+        if enabled:
+            conditions.append(f"{column} = ${param_idx}")
+            param_idx += 1
+
+    where_clause = " AND ".join(conditions)
+
+    # The window count is computed before LIMIT, so it carries the full total.
+    # Rows are rendered to JSON by Postgres; only the total is read in Python.
+    return f"""
+        WITH page AS (
+            SELECT {_SEARCH_COLUMNS}, COUNT(*) OVER () AS _total
+            FROM incidents
+            WHERE {where_clause}
+            ORDER BY last_seen_at DESC
+            LIMIT ${param_idx}
+        )
+        SELECT
+            (
+                SELECT COALESCE(json_agg(r), '[]'::json)
+                FROM (SELECT {_SEARCH_COLUMNS} FROM page ORDER BY last_seen_at DESC) r
+            )::text AS results,
+            (SELECT COALESCE(MAX(_total), 0) FROM page) AS total
+        """
 
 
 @router.get("/stats/search")
@@ -583,61 +663,19 @@ async def search_incidents(
     current_user: dict = Depends(get_current_user)
 ):
     """Search incidents with filters."""
-    conditions = ["created_at >= NOW() - INTERVAL '1 day' * $1"]
     params = [days]
-    param_idx = 2
-
-    # Text search
     if q:
-        conditions.append(f"""
-            (title ILIKE ${param_idx}
-             OR host ILIKE ${param_idx}
-             OR check_name ILIKE ${param_idx}
-             OR service ILIKE ${param_idx}
-             OR fingerprint ILIKE ${param_idx})
-        """)
-        params.append(f"%{q}%")
-        param_idx += 1
-
-    if status:
-        conditions.append(f"status = ${param_idx}")
-        params.append(status)
-        param_idx += 1
-
-    if severity:
-        conditions.append(f"severity = ${param_idx}")
-        params.append(severity)
-        param_idx += 1
-
-    if source:
-        conditions.append(f"source_tool = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions)
+        params.extend([q, f"%{q}%"])
+    params.extend(p for p in (status, severity, source) if p)
 
-    results = await conn.fetch(
-        f"""
-        SELECT
-            id, fingerprint, title, source_tool, host, check_name, service,
-            severity, status, first_seen_at, last_seen_at, event_count,
-            is_in_maintenance
-        FROM incidents
-        WHERE {where_clause}
-        ORDER BY last_seen_at DESC
-        LIMIT ${param_idx}
-        """,
+    page = await conn.fetchrow(
+        _search_sql(bool(q), bool(status), bool(severity), bool(source)),
         *params, limit
     )
 
-    total = await conn.fetchval(
-        f"SELECT COUNT(*) FROM incidents WHERE {where_clause}",
-        *params
-    )
-
-    return {
-        "results": [dict(r) for r in results],
-        "total": total,
+    return _json_response(orjson.dumps({
+        "results": orjson.Fragment(page["results"]),
+        "total": page["total"],
         "query": q,
         "filters": {"status": status, "severity": severity, "source": source, "days": days}
-    }
+    }))
@@ -1,9 +1,12 @@
 """Authentication router."""
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Annotated
+from typing import Annotated, Dict, Optional, Tuple
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -18,23 +21,60 @@ from app.schemas.common import UserRole
 logger = structlog.get_logger()
 router = APIRouter()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+settings = get_settings()
+JWT_ALGORITHMS = (settings.jwt_algorithm,)
+
+# New hashes use argon2id; bcrypt hashes still verify and are upgraded on login
+pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated=["bcrypt"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 
+# Roles allowed to perform operator-level writes and reads
+OPERATOR_ROLES = frozenset({UserRole.OPERATOR.value, UserRole.ADMIN.value})
+
+# Verified tokens map to their subject for a short while so repeat requests
+# skip the signature check. The user row is still read on every request, so
+# a disabled or demoted user loses access immediately.
+TOKEN_CACHE_TTL_SECONDS = 60
+TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: Dict[bytes, Tuple[float, str]] = {}
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Derive a compact cache key from a bearer token."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hash."""
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Verify password and return a replacement hash if the stored one is outdated."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def hash_password(password: str) -> str:
     """Hash a password."""
     return pwd_context.hash(password)
 
 
+def is_usable_hash(hashed_password: str) -> bool:
+    """Check that a stored hash parses for a known scheme, without verifying it."""
+    scheme = pwd_context.identify(hashed_password, required=False)
+    if scheme is None:
+        return False
+    try:
+        pwd_context.handler(scheme).from_string(hashed_password)
+    except ValueError:
+        return False
+    return True
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create JWT access token."""
-    settings = get_settings()
     to_encode = data.copy()
 
     if expires_delta:
@@ -54,22 +94,37 @@ async def get_current_user(
     conn=Depends(get_db_connection)
 ) -> dict:
     """Get current user from JWT token."""
-    settings = get_settings()
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(
-            token, settings.jwt_secret, algorithms=[settings.jwt_algorithm]
-        )
-        username: str = payload.get("sub")
-        if username is None:
+    now = time.time()
+    cache_key = _token_cache_key(token)
+    cached = _token_cache.get(cache_key)
+    if cached is not None and cached[0] > now:
+        username = cached[1]
+    else:
+        _token_cache.pop(cache_key, None)
+        try:
+            payload = jwt.decode(
+                token, settings.jwt_secret, algorithms=JWT_ALGORITHMS
+            )
+            username: str = payload.get("sub")
+            if username is None:
+                raise credentials_exception
+        except JWTError:
             raise credentials_exception
-    except JWTError:
-        raise credentials_exception
+
+        # Never cache past the token's own expiry
+        expires_at = now + TOKEN_CACHE_TTL_SECONDS
+        if payload.get("exp"):
+            expires_at = min(expires_at, payload["exp"])
+
+        if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            _token_cache.clear()
+        _token_cache[cache_key] = (expires_at, username)
 
     user = await conn.fetchrow(
         """
@@ -91,13 +146,19 @@ async def get_current_user(
     return dict(user)
 
 
-async def require_role(roles: list[UserRole]):
-    """Dependency to require specific roles."""
+def require_role(roles: list[UserRole], detail: str = "Insufficient permissions"):
+    """Dependency to require specific roles.
+
+    Build it once at module level so FastAPI's per-request dependency cache
+    shares the resolved user with ``get_current_user``.
+    """
+    allowed = frozenset(r.value for r in roles)
+
     async def role_checker(user: dict = Depends(get_current_user)):
-        if user["role"] not in [r.value for r in roles]:
+        if user["role"] not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="Insufficient permissions"
+                detail=detail
             )
         return user
     return role_checker
@@ -109,14 +170,18 @@ async def login_for_access_token(
     conn=Depends(get_db_connection)
 ):
     """OAuth2 compatible token login."""
-    settings = get_settings()
-
     user = await conn.fetchrow(
         "SELECT * FROM users WHERE username = $1",
         form_data.username
     )
 
-    if not user or not verify_password(form_data.password, user["password_hash"]):
+    verified, new_hash = False, None
+    if user:
+        verified, new_hash = await run_in_threadpool(
+            verify_and_update_password, form_data.password, user["password_hash"]
+        )
+
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -129,10 +194,14 @@ async def login_for_access_token(
             detail="User account is disabled"
         )
 
-    # Update last login
+    # Update last login, upgrading the password hash if needed
     await conn.execute(
-        "UPDATE users SET last_login_at = NOW() WHERE id = $1",
-        user["id"]
+        """
+        UPDATE users SET last_login_at = NOW(),
+            password_hash = COALESCE($2, password_hash)
+        WHERE id = $1
+        """,
+        user["id"], new_hash
     )
 
     access_token = create_access_token(
@@ -154,14 +223,18 @@ async def login(
     conn=Depends(get_db_connection)
 ):
     """JSON login endpoint."""
-    settings = get_settings()
-
     user = await conn.fetchrow(
         "SELECT * FROM users WHERE username = $1",
         request.username
     )
 
-    if not user or not verify_password(request.password, user["password_hash"]):
+    verified, new_hash = False, None
+    if user:
+        verified, new_hash = await run_in_threadpool(
+            verify_and_update_password, request.password, user["password_hash"]
+        )
+
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password"
@@ -174,8 +247,12 @@ async def login(
         )
 
     await conn.execute(
-        "UPDATE users SET last_login_at = NOW() WHERE id = $1",
-        user["id"]
+        """
+        UPDATE users SET last_login_at = NOW(),
+            password_hash = COALESCE($2, password_hash)
+        WHERE id = $1
+        """,
+        user["id"], new_hash
     )
 
     access_token = create_access_token(
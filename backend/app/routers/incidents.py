@@ -1,10 +1,13 @@
 """Incidents router."""
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 
 from app.database import get_db_connection
 from app.routers.auth import get_current_user
@@ -15,11 +18,110 @@ from app.schemas.incidents import (
     RawEmailResponse
 )
 from app.schemas.common import IncidentStatus, SeverityLevel, PaginatedResponse
-from app.services.audit import log_audit
+from app.services.pagination import decode_cursor, encode_cursor
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# SQL type of each sortable column, used to bind cursor values
+SORT_COLUMN_TYPES = {
+    "last_seen_at": "timestamptz",
+    "first_seen_at": "timestamptz",
+    "severity": "severity_level",
+    "event_count": "int",
+}
+
+# Whole-list validator: one compiled core call per response instead of one
+# model construction per row. Pages are returned as encoded Responses so
+# FastAPI's response_model does not validate the same items a second time.
+_INCIDENT_SUMMARY_LIST = TypeAdapter(List[IncidentSummary])
+_INCIDENT_PAGE = PaginatedResponse[IncidentSummary]
+
+# AlertEventResponse fields, for lists serialized by Postgres directly
+ALERT_EVENT_COLUMNS = """
+    ae.id, ae.raw_email_id, ae.source_tool, ae.environment, ae.region, ae.host,
+    ae.check_name, ae.service, ae.severity, ae.state, ae.occurred_at,
+    ae.normalized_signature, ae.fingerprint, ae.payload, ae.tags,
+    ae.is_suppressed, ae.suppression_reason, ae.created_at
+"""
+
+INCIDENT_SUMMARY_COLUMNS = """
+    id, fingerprint, title, source_tool, environment, region, host, check_name,
+    service, severity, status, first_seen_at, last_seen_at, event_count,
+    is_in_maintenance, ai_category, owner_team, tags, labels, description
+"""
+
+# IncidentDetail fields. Selecting these instead of i.* keeps the generated
+# search columns and legacy columns off the wire and out of row decoding.
+INCIDENT_DETAIL_COLUMNS = """
+    i.id, i.fingerprint, i.title, i.source_tool, i.environment, i.region, i.host,
+    i.check_name, i.service, i.severity, i.status, i.first_seen_at, i.last_seen_at,
+    i.event_count, i.is_in_maintenance, i.ai_category, i.owner_team, i.tags,
+    i.labels, i.description, i.resolved_at, i.acknowledged_at, i.acknowledged_by,
+    i.resolved_by, i.assigned_to, i.maintenance_window_id, i.flap_count,
+    i.last_state_change_at, i.created_at, i.updated_at, i.ai_summary,
+    i.ai_owner_team, i.ai_recommended_checks, i.ai_suggested_runbooks,
+    i.ai_safe_actions, i.ai_confidence, i.ai_evidence, i.ai_enriched_at, i.ai_labels
+"""
+
+
+# list_incidents filters in parameter order; {0} is the filter's placeholder
+# number. Multi-value filters bind one array parameter so the SQL text
+# depends only on which filters are set, not how many values.
+_INCIDENT_FILTERS = (
+    ("status", "status = ANY(${0}::incident_status[])"),
+    ("severity", "severity = ANY(${0}::severity_level[])"),
+    ("source_tool", "source_tool = ANY(${0}::text[])"),
+    ("environment", "environment = ANY(${0}::text[])"),
+    ("host", "host ILIKE ${0}"),
+    ("in_maintenance", "is_in_maintenance = ${0}"),
+    ("search", "(title ILIKE ${0} OR host ILIKE ${0} OR check_name ILIKE ${0})"),
+    ("from_date", "last_seen_at >= ${0}"),
+    ("to_date", "last_seen_at <= ${0}"),
+)
+
+
+@lru_cache(maxsize=128)
+def _incident_where(filters: Tuple[str, ...]) -> Tuple[str, int]:
+    """Build the WHERE clause for the given active filters.
+
+    Returns the clause and the next free placeholder number.
+    """
+    templates = [template for name, template in _INCIDENT_FILTERS if name in filters]
+    conditions = [template.format(idx) for idx, template in enumerate(templates, start=1)]
+    return " AND ".join(conditions) if conditions else "1=1", len(conditions) + 1
+
+
+@lru_cache(maxsize=512)
+def _incident_list_sql(filters: Tuple[str, ...], order_col: str, order_dir: str, keyset: bool) -> str:
+    """Build the list_incidents page query for one filter and sort shape.
+
+    Filter values come first. In keyset mode the cursor's sort value and id
+    follow, then the limit; otherwise the limit and offset follow and each
+    row carries the total match count.
+    """
+    where_clause, param_idx = _incident_where(filters)
+
+    if keyset:
+        comparison = "<" if order_dir == "DESC" else ">"
+        return f"""
+            SELECT {INCIDENT_SUMMARY_COLUMNS}
+            FROM incidents
+            WHERE {where_clause}
+              AND ({order_col}, id) {comparison}
+                  (${param_idx}::text::{SORT_COLUMN_TYPES[order_col]}, ${param_idx + 1})
+            ORDER BY {order_col} {order_dir}, id {order_dir}
+            LIMIT ${param_idx + 2}
+            """
+
+    return f"""
+        SELECT {INCIDENT_SUMMARY_COLUMNS}, COUNT(*) OVER () AS _total
+        FROM incidents
+        WHERE {where_clause}
+        ORDER BY {order_col} {order_dir}, id {order_dir}
+        LIMIT ${param_idx} OFFSET ${param_idx + 1}
+        """
+
 
 @router.get("", response_model=PaginatedResponse[IncidentSummary])
 async def list_incidents(
@@ -36,96 +138,98 @@ async def list_incidents(
     sort_order: str = Query("desc", regex="^(asc|desc)$"),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
     conn=Depends(get_db_connection),
     current_user: dict = Depends(get_current_user)
 ):
-    """List incidents with filters and pagination."""
-    # Build dynamic query
-    conditions = []
-    params = []
-    param_idx = 1
-
-    if status:
-        placeholders = [f"${param_idx + i}" for i in range(len(status))]
-        conditions.append(f"status IN ({', '.join(placeholders)})")
-        params.extend([s.value for s in status])
-        param_idx += len(status)
-
-    if severity:
-        placeholders = [f"${param_idx + i}" for i in range(len(severity))]
-        conditions.append(f"severity IN ({', '.join(placeholders)})")
-        params.extend([s.value for s in severity])
-        param_idx += len(severity)
-
-    if source_tool:
-        placeholders = [f"${param_idx + i}" for i in range(len(source_tool))]
-        conditions.append(f"source_tool IN ({', '.join(placeholders)})")
-        params.extend(source_tool)
-        param_idx += len(source_tool)
-
-    if environment:
-        placeholders = [f"${param_idx + i}" for i in range(len(environment))]
-        conditions.append(f"environment IN ({', '.join(placeholders)})")
-        params.extend(environment)
-        param_idx += len(environment)
-
-    if host:
-        conditions.append(f"host ILIKE ${param_idx}")
-        params.append(f"%{host}%")
-        param_idx += 1
-
-    if in_maintenance is not None:
-        conditions.append(f"is_in_maintenance = ${param_idx}")
-        params.append(in_maintenance)
-        param_idx += 1
-
-    if search:
-        conditions.append(f"(title ILIKE ${param_idx} OR host ILIKE ${param_idx} OR check_name ILIKE ${param_idx})")
-        params.append(f"%{search}%")
-        param_idx += 1
-
-    if from_date:
-        conditions.append(f"last_seen_at >= ${param_idx}")
-        params.append(from_date)
-        param_idx += 1
-
-    if to_date:
-        conditions.append(f"last_seen_at <= ${param_idx}")
-        params.append(to_date)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-    # Get total count
-    count_query = f"SELECT COUNT(*) FROM incidents WHERE {where_clause}"
-    total = await conn.fetchval(count_query, *params)
-
-    # Get paginated results
-    offset = (page - 1) * page_size
+    """List incidents with filters and pagination.
+
+    Pass ``cursor`` (from a previous ``next_cursor``) for keyset pagination,
+    which skips the total count and stays fast on deep pages; ``page`` is
+    ignored in that mode.
+    """
+    values = {
+        "status": [s.value for s in status] if status else None,
+        "severity": [s.value for s in severity] if severity else None,
+        "source_tool": source_tool or None,
+        "environment": environment or None,
+        "host": f"%{host}%" if host else None,
+        "in_maintenance": in_maintenance,
+        "search": f"%{search}%" if search else None,
+        "from_date": from_date,
+        "to_date": to_date,
+    }
+    filters = tuple(name for name, _ in _INCIDENT_FILTERS if values[name] is not None)
+    params = [values[name] for name in filters]
+
     order_col = sort_by
     order_dir = sort_order.upper()
 
-    query = f"""
-        SELECT id, fingerprint, title, source_tool, environment, region, host, check_name,
-               service, severity, status, first_seen_at, last_seen_at, event_count,
-               is_in_maintenance, ai_category, owner_team, tags, labels, description
-        FROM incidents
-        WHERE {where_clause}
-        ORDER BY {order_col} {order_dir}
-        LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """
-    params.extend([page_size, offset])
+    if cursor is not None:
+        # Keyset pagination on (sort column, id); fetch one extra row to
+        # learn whether another page follows
+        last_value, last_id = decode_cursor(cursor, 2)
+        try:
+            last_id = UUID(last_id)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        rows = await conn.fetch(
+            _incident_list_sql(filters, order_col, order_dir, True),
+            *params, str(last_value), last_id, page_size + 1
+        )
 
-    rows = await conn.fetch(query, *params)
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = (
+            encode_cursor(rows[-1][order_col], str(rows[-1]["id"])) if has_more else None
+        )
 
-    total_pages = (total + page_size - 1) // page_size
+        return Response(
+            content=_INCIDENT_PAGE(
+                items=_INCIDENT_SUMMARY_LIST.validate_python([dict(row) for row in rows]),
+                page=page,
+                page_size=page_size,
+                next_cursor=next_cursor,
+                has_more=has_more
+            ).model_dump_json(),
+            media_type="application/json"
+        )
 
-    return PaginatedResponse(
-        items=[IncidentSummary(**dict(row)) for row in rows],
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages
+    # Get paginated results; the window count carries the total match count
+    offset = (page - 1) * page_size
+    rows = await conn.fetch(
+        _incident_list_sql(filters, order_col, order_dir, False),
+        *params, page_size, offset
+    )
+
+    if rows:
+        total = rows[0]["_total"]
+    elif page > 1:
+        # Past the last page there is no row to carry the count
+        where_clause, _ = _incident_where(filters)
+        total = await conn.fetchval(
+            f"SELECT COUNT(*) FROM incidents WHERE {where_clause}", *params
+        )
+    else:
+        total = 0
+
+    total_pages = (total + page_size - 1) // page_size
+    has_more = page < total_pages
+
+    return Response(
+        content=_INCIDENT_PAGE(
+            items=_INCIDENT_SUMMARY_LIST.validate_python([dict(row) for row in rows]),
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            next_cursor=(
+                encode_cursor(rows[-1][order_col], str(rows[-1]["id"])) if has_more and rows else None
+            ),
+            has_more=has_more
+        ).model_dump_json(),
+        media_type="application/json"
     )
 
 
@@ -137,49 +241,61 @@ async def get_incident(
     current_user: dict = Depends(get_current_user)
 ):
     """Get incident details with events."""
-    incident = await conn.fetchrow(
-        """
-        SELECT * FROM incidents WHERE id = $1
+    event_limit = 1000 if include_all_events else 50
+
+    # Incident, events and recent (last 10 non-deduplicated) events in one
+    # round-trip, rendered to a single JSON document by Postgres so up to
+    # 1000 events are never materialized as Python objects
+    payload = await conn.fetchval(
+        f"""
+        SELECT row_to_json(d)::text
+        FROM (
+            SELECT {INCIDENT_DETAIL_COLUMNS},
+                (
+                    SELECT COALESCE(json_agg(e ORDER BY e.occurred_at DESC), '[]'::json)
+                    FROM (
+                        SELECT {ALERT_EVENT_COLUMNS} FROM alert_events ae
+                        JOIN incident_events ie ON ie.alert_event_id = ae.id
+                        WHERE ie.incident_id = i.id
+                        ORDER BY ae.occurred_at DESC
+                        LIMIT $2
+                    ) e
+                ) AS events,
+                (
+                    SELECT COALESCE(json_agg(e ORDER BY e.occurred_at DESC), '[]'::json)
+                    FROM (
+                        SELECT {ALERT_EVENT_COLUMNS} FROM alert_events ae
+                        JOIN incident_events ie ON ie.alert_event_id = ae.id
+                        WHERE ie.incident_id = i.id AND ie.is_deduplicated = false
+                        ORDER BY ae.occurred_at DESC
+                        LIMIT 10
+                    ) e
+                ) AS recent_events
+            FROM incidents i
+            WHERE i.id = $1
+        ) d
         """,
-        incident_id
+        incident_id, event_limit
     )
 
-    if not incident:
+    if payload is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Incident not found"
         )
 
-    # Get events
-    event_limit = 1000 if include_all_events else 50
-    events = await conn.fetch(
-        """
-        SELECT ae.* FROM alert_events ae
-        JOIN incident_events ie ON ie.alert_event_id = ae.id
-        WHERE ie.incident_id = $1
-        ORDER BY ae.occurred_at DESC
-        LIMIT $2
-        """,
-        incident_id, event_limit
-    )
+    return Response(content=payload, media_type="application/json")
 
-    # Get recent events (last 10 non-deduplicated)
-    recent_events = await conn.fetch(
-        """
-        SELECT ae.* FROM alert_events ae
-        JOIN incident_events ie ON ie.alert_event_id = ae.id
-        WHERE ie.incident_id = $1 AND ie.is_deduplicated = false
-        ORDER BY ae.occurred_at DESC
-        LIMIT 10
-        """,
-        incident_id
-    )
 
-    incident_dict = dict(incident)
-    incident_dict["events"] = [AlertEventResponse(**dict(e)) for e in events]
-    incident_dict["recent_events"] = [AlertEventResponse(**dict(e)) for e in recent_events]
+def _incident_list_response(payload: Optional[str]) -> Response:
+    """Return a Postgres-built JSON list, or 404 when it came back NULL.
 
-    return IncidentWithEvents(**incident_dict)
+    The list queries yield NULL instead of an empty array when the incident
+    itself does not exist.
+    """
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Incident not found")
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/{incident_id}/events", response_model=List[AlertEventResponse])
@@ -192,13 +308,6 @@ async def get_incident_events(
     current_user: dict = Depends(get_current_user)
 ):
     """Get events for an incident."""
-    # Verify incident exists
-    exists = await conn.fetchval(
-        "SELECT 1 FROM incidents WHERE id = $1", incident_id
-    )
-    if not exists:
-        raise HTTPException(status_code=404, detail="Incident not found")
-
     conditions = ["ie.incident_id = $1"]
     params = [incident_id]
 
@@ -208,18 +317,23 @@ async def get_incident_events(
 
     where_clause = " AND ".join(conditions)
 
-    events = await conn.fetch(
+    payload = await conn.fetchval(
         f"""
-        SELECT ae.* FROM alert_events ae
-        JOIN incident_events ie ON ie.alert_event_id = ae.id
-        WHERE {where_clause}
-        ORDER BY ae.occurred_at DESC
-        LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+        SELECT CASE WHEN EXISTS (SELECT 1 FROM incidents WHERE id = $1) THEN (
+            SELECT COALESCE(json_agg(e ORDER BY e.occurred_at DESC), '[]'::json)
+            FROM (
+                SELECT {ALERT_EVENT_COLUMNS} FROM alert_events ae
+                JOIN incident_events ie ON ie.alert_event_id = ae.id
+                WHERE {where_clause}
+                ORDER BY ae.occurred_at DESC
+                LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+            ) e
+        ) END::text
         """,
         *params, limit, offset
     )
 
-    return [AlertEventResponse(**dict(e)) for e in events]
+    return _incident_list_response(payload)
 
 
 @router.get("/{incident_id}/raw-email/{event_id}", response_model=RawEmailResponse)
@@ -246,6 +360,76 @@ async def get_raw_email(
     return RawEmailResponse(**dict(email))
 
 
+def _status_transition_sql(action: str, set_clause: str, allowed: str, extra: str = "") -> str:
+    """Build a status change that also writes its comments and audit entry.
+
+    The incident is locked and its previous status read, the UPDATE applies
+    only when ``allowed`` holds for that status, and the comments and audit
+    row are inserted from the updated row, all in one statement.
+
+    Parameters: $1 incident id, $2 user id, $3 optional user comment,
+    $4 system comment, $5 audit new_value. ``extra`` may append further
+    CTEs that read from ``upd`` and use later parameters.
+
+    Returns no row if the incident does not exist, and a row with a NULL
+    ``id`` (but ``previous_status`` set) if the transition was not allowed.
+    """
+    return f"""
+        WITH prev AS (
+            SELECT id, status FROM incidents WHERE id = $1 FOR UPDATE
+        ),
+        upd AS (
+            UPDATE incidents i
+            SET {set_clause}, updated_at = NOW()
+            FROM prev
+            WHERE i.id = prev.id AND {allowed}
+            RETURNING {INCIDENT_DETAIL_COLUMNS}
+        ),
+        comments AS (
+            INSERT INTO incident_comments (incident_id, user_id, content, is_system_generated)
+            SELECT upd.id, $2, v.content, v.is_system_generated
+            FROM upd, (VALUES ($3::text, false), ($4::text, true)) AS v(content, is_system_generated)
+            WHERE v.content IS NOT NULL
+        ),
+        audit AS (
+            INSERT INTO audit_log (user_id, action, entity_type, entity_id, old_value, new_value)
+            SELECT $2, '{action}', 'incident', upd.id,
+                   jsonb_build_object('status', prev.status), $5::jsonb
+            FROM upd, prev
+        ){extra}
+        SELECT prev.status AS previous_status, upd.*
+        FROM prev LEFT JOIN upd ON true
+        """
+
+
+_ACKNOWLEDGE_SQL = _status_transition_sql(
+    "acknowledge",
+    "status = 'acknowledged', acknowledged_at = NOW(), acknowledged_by = $2",
+    "prev.status = 'open'",
+)
+
+_RESOLVE_SQL = _status_transition_sql(
+    "resolve",
+    "status = 'resolved', resolved_at = NOW(), resolved_by = $2",
+    "prev.status <> 'resolved'",
+)
+
+# $6 reason and $7 duration in minutes; no rule is created without a duration
+_SUPPRESS_SQL = _status_transition_sql(
+    "suppress",
+    "status = 'suppressed'",
+    "true",
+    """,
+        rule AS (
+            INSERT INTO suppression_rules (name, scope, reason, start_at, end_at, created_by)
+            SELECT 'Suppress incident ' || upd.id, jsonb_build_object('fingerprint', upd.fingerprint),
+                   $6, NOW(), NOW() + INTERVAL '1 minute' * $7, $2
+            FROM upd
+            WHERE $7 IS NOT NULL
+        )""",
+)
+
+
 @router.post("/{incident_id}/ack", response_model=IncidentDetail)
 async def acknowledge_incident(
     incident_id: UUID,
@@ -254,53 +438,22 @@ async def acknowledge_incident(
     current_user: dict = Depends(get_current_user)
 ):
     """Acknowledge an incident."""
-    incident = await conn.fetchrow(
-        "SELECT * FROM incidents WHERE id = $1", incident_id
+    updated = await conn.fetchrow(
+        _ACKNOWLEDGE_SQL,
+        incident_id, current_user["id"], request.comment,
+        f"Incident acknowledged by {current_user['username']}",
+        {"status": "acknowledged"}
     )
 
-    if not incident:
+    if not updated:
         raise HTTPException(status_code=404, detail="Incident not found")
 
-    if incident["status"] not in ("open",):
+    if updated["id"] is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Cannot acknowledge incident with status {incident['status']}"
-        )
-
-    updated = await conn.fetchrow(
-        """
-        UPDATE incidents
-        SET status = 'acknowledged', acknowledged_at = NOW(), acknowledged_by = $2, updated_at = NOW()
-        WHERE id = $1
-        RETURNING *
-        """,
-        incident_id, current_user["id"]
-    )
-
-    # Add system comment
-    if request.comment:
-        await conn.execute(
-            """
-            INSERT INTO incident_comments (incident_id, user_id, content, is_system_generated)
-            VALUES ($1, $2, $3, false)
-            """,
-            incident_id, current_user["id"], request.comment
+            detail=f"Cannot acknowledge incident with status {updated['previous_status']}"
         )
 
-    await conn.execute(
-        """
-        INSERT INTO incident_comments (incident_id, user_id, content, is_system_generated)
-        VALUES ($1, $2, $3, true)
-        """,
-        incident_id, current_user["id"], f"Incident acknowledged by {current_user['username']}"
-    )
-
-    # Audit log
-    await log_audit(
-        conn, current_user["id"], "acknowledge", "incident", incident_id,
-        {"status": incident["status"]}, {"status": "acknowledged"}
-    )
-
     logger.info("Incident acknowledged", incident_id=str(incident_id), by=current_user["username"])
 
     return IncidentDetail(**dict(updated))
@@ -314,48 +467,19 @@ async def resolve_incident(
     current_user: dict = Depends(get_current_user)
 ):
     """Resolve an incident."""
-    incident = await conn.fetchrow(
-        "SELECT * FROM incidents WHERE id = $1", incident_id
+    updated = await conn.fetchrow(
+        _RESOLVE_SQL,
+        incident_id, current_user["id"], request.comment,
+        f"Incident resolved by {current_user['username']}",
+        {"status": "resolved"}
     )
 
-    if not incident:
+    if not updated:
         raise HTTPException(status_code=404, detail="Incident not found")
 
-    if incident["status"] == "resolved":
+    if updated["id"] is None:
         raise HTTPException(status_code=400, detail="Incident is already resolved")
 
-    updated = await conn.fetchrow(
-        """
-        UPDATE incidents
-        SET status = 'resolved', resolved_at = NOW(), resolved_by = $2, updated_at = NOW()
-        WHERE id = $1
-        RETURNING *
-        """,
-        incident_id, current_user["id"]
-    )
-
-    if request.comment:
-        await conn.execute(
-            """
-            INSERT INTO incident_comments (incident_id, user_id, content, is_system_generated)
-            VALUES ($1, $2, $3, false)
-            """,
-            incident_id, current_user["id"], request.comment
-        )
-
-    await conn.execute(
-        """
-        INSERT INTO incident_comments (incident_id, user_id, content, is_system_generated)
-        VALUES ($1, $2, $3, true)
-        """,
-        incident_id, current_user["id"], f"Incident resolved by {current_user['username']}"
-    )
-
-    await log_audit(
-        conn, current_user["id"], "resolve", "incident", incident_id,
-        {"status": incident["status"]}, {"status": "resolved"}
-    )
-
     logger.info("Incident resolved", incident_id=str(incident_id), by=current_user["username"])
 
     return IncidentDetail(**dict(updated))
@@ -369,50 +493,16 @@ async def suppress_incident(
     current_user: dict = Depends(get_current_user)
 ):
     """Suppress an incident."""
-    incident = await conn.fetchrow(
-        "SELECT * FROM incidents WHERE id = $1", incident_id
-    )
-
-    if not incident:
-        raise HTTPException(status_code=404, detail="Incident not found")
-
     updated = await conn.fetchrow(
-        """
-        UPDATE incidents
-        SET status = 'suppressed', updated_at = NOW()
-        WHERE id = $1
-        RETURNING *
-        """,
-        incident_id
-    )
-
-    # Create suppression rule if duration specified
-    if request.duration_minutes:
-        await conn.execute(
-            """
-            INSERT INTO suppression_rules (name, scope, reason, start_at, end_at, created_by)
-            VALUES ($1, $2, $3, NOW(), NOW() + INTERVAL '1 minute' * $4, $5)
-            """,
-            f"Suppress incident {incident_id}",
-            {"fingerprint": incident["fingerprint"]},
-            request.reason,
-            request.duration_minutes,
-            current_user["id"]
-        )
-
-    await conn.execute(
-        """
-        INSERT INTO incident_comments (incident_id, user_id, content, is_system_generated)
-        VALUES ($1, $2, $3, true)
-        """,
-        incident_id, current_user["id"],
-        f"Incident suppressed by {current_user['username']}: {request.reason}"
+        _SUPPRESS_SQL,
+        incident_id, current_user["id"], None,
+        f"Incident suppressed by {current_user['username']}: {request.reason}",
+        {"status": "suppressed", "reason": request.reason},
+        request.reason, request.duration_minutes
     )
 
-    await log_audit(
-        conn, current_user["id"], "suppress", "incident", incident_id,
-        {"status": incident["status"]}, {"status": "suppressed", "reason": request.reason}
-    )
+    if not updated:
+        raise HTTPException(status_code=404, detail="Incident not found")
 
     logger.info("Incident suppressed", incident_id=str(incident_id), by=current_user["username"])
 
@@ -426,20 +516,18 @@ async def get_incident_comments(
     current_user: dict = Depends(get_current_user)
 ):
     """Get comments for an incident."""
-    exists = await conn.fetchval("SELECT 1 FROM incidents WHERE id = $1", incident_id)
-    if not exists:
-        raise HTTPException(status_code=404, detail="Incident not found")
-
-    comments = await conn.fetch(
+    payload = await conn.fetchval(
         """
-        SELECT * FROM incident_comments
-        WHERE incident_id = $1
-        ORDER BY created_at DESC
+        SELECT CASE WHEN EXISTS (SELECT 1 FROM incidents WHERE id = $1) THEN (
+            SELECT COALESCE(json_agg(c ORDER BY c.created_at DESC), '[]'::json)
+            FROM incident_comments c
+            WHERE c.incident_id = $1
+        ) END::text
         """,
         incident_id
     )
 
-    return [IncidentComment(**dict(c)) for c in comments]
+    return _incident_list_response(payload)
 
 
 @router.post("/{incident_id}/comment", response_model=IncidentComment, status_code=201)
@@ -450,19 +538,18 @@ async def add_incident_comment(
     current_user: dict = Depends(get_current_user)
 ):
     """Add a comment to an incident."""
-    exists = await conn.fetchval("SELECT 1 FROM incidents WHERE id = $1", incident_id)
-    if not exists:
-        raise HTTPException(status_code=404, detail="Incident not found")
-
     comment = await conn.fetchrow(
         """
         INSERT INTO incident_comments (incident_id, user_id, content, is_system_generated)
-        VALUES ($1, $2, $3, false)
+        SELECT id, $2, $3, false FROM incidents WHERE id = $1
         RETURNING *
         """,
         incident_id, current_user["id"], request.content
     )
 
+    if not comment:
+        raise HTTPException(status_code=404, detail="Incident not found")
+
     logger.info("Comment added", incident_id=str(incident_id), by=current_user["username"])
 
     return IncidentComment(**dict(comment))
@@ -476,7 +563,21 @@ async def get_incident_maintenance(
 ):
     """Get maintenance window info for an incident."""
     incident = await conn.fetchrow(
-        "SELECT * FROM incidents WHERE id = $1", incident_id
+        """
+        SELECT i.is_in_maintenance,
+            CASE WHEN i.is_in_maintenance THEN (
+                SELECT row_to_json(mw) FROM maintenance_windows mw
+                WHERE mw.id = i.maintenance_window_id
+            ) END AS "window",
+            CASE WHEN i.is_in_maintenance THEN (
+                SELECT COALESCE(json_agg(mm ORDER BY mm.matched_at DESC), '[]'::json)
+                FROM maintenance_matches mm
+                WHERE mm.incident_id = i.id
+            ) END AS matches
+        FROM incidents i
+        WHERE i.id = $1
+        """,
+        incident_id
     )
 
     if not incident:
@@ -485,24 +586,8 @@ async def get_incident_maintenance(
     if not incident["is_in_maintenance"]:
         return {"in_maintenance": False, "window": None, "matches": []}
 
-    window = None
-    if incident["maintenance_window_id"]:
-        window = await conn.fetchrow(
-            "SELECT * FROM maintenance_windows WHERE id = $1",
-            incident["maintenance_window_id"]
-        )
-
-    matches = await conn.fetch(
-        """
-        SELECT * FROM maintenance_matches
-        WHERE incident_id = $1
-        ORDER BY matched_at DESC
-        """,
-        incident_id
-    )
-
     return {
         "in_maintenance": True,
-        "window": dict(window) if window else None,
-        "matches": [dict(m) for m in matches]
+        "window": incident["window"],
+        "matches": incident["matches"]
     }
@@ -5,19 +5,30 @@ from uuid import UUID
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 
-from app.database import get_db_connection
-from app.routers.auth import get_current_user
+from app.database import get_db_connection, get_db_pool
+from app.routers.auth import OPERATOR_ROLES, get_current_user
 from app.schemas.maintenance import (
     MaintenanceWindowCreate, MaintenanceWindowUpdate, MaintenanceWindowResponse,
     MaintenanceWindowDetail, MaintenanceMatchResponse, MaintenanceFilters
 )
 from app.schemas.common import MaintenanceSource, PaginatedResponse
-from app.services.audit import log_audit
+from app.services.cache import ttl_cache
+from app.services.pagination import decode_cursor, encode_cursor
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Active windows change at minute granularity but are polled constantly
+ACTIVE_CACHE_TTL_SECONDS = 5.0
+
+# Whole-list validators: one compiled core call per response. Pages are
+# returned as encoded Responses so response_model does not validate twice.
+_WINDOW_LIST = TypeAdapter(List[MaintenanceWindowResponse])
+_WINDOW_PAGE = PaginatedResponse[MaintenanceWindowResponse]
+
 
 @router.get("", response_model=PaginatedResponse[MaintenanceWindowResponse])
 async def list_maintenance_windows(
@@ -29,19 +40,23 @@ async def list_maintenance_windows(
     include_past: bool = Query(False),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
     conn=Depends(get_db_connection),
     current_user: dict = Depends(get_current_user)
 ):
-    """List maintenance windows with filters."""
+    """List maintenance windows with filters.
+
+    Pass ``cursor`` (from a previous ``next_cursor``) for keyset pagination,
+    which skips the total count; ``page`` is ignored in that mode.
+    """
     conditions = []
     params = []
     param_idx = 1
 
     if source:
-        placeholders = [f"${param_idx + i}" for i in range(len(source))]
-        conditions.append(f"source IN ({', '.join(placeholders)})")
-        params.extend([s.value for s in source])
-        param_idx += len(source)
+        conditions.append(f"source = ANY(${param_idx}::maintenance_source[])")
+        params.append([s.value for s in source])
+        param_idx += 1
 
     if is_active is not None:
         conditions.append(f"is_active = ${param_idx}")
@@ -49,9 +64,7 @@ async def list_maintenance_windows(
         param_idx += 1
 
     if not include_past:
-        conditions.append(f"end_ts >= ${param_idx}")
-        params.append(datetime.utcnow())
-        param_idx += 1
+        conditions.append("end_ts >= NOW()")
 
     if from_date:
         conditions.append(f"start_ts >= ${param_idx}")
@@ -68,47 +81,105 @@ async def list_maintenance_windows(
         params.append(f"%{search}%")
         param_idx += 1
 
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    if cursor is not None:
+        # Keyset pagination on (start_ts, id); fetch one extra row to learn
+        # whether another page follows
+        last_start, last_id = decode_cursor(cursor, 2)
+        try:
+            last_id = UUID(last_id)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        conditions.append(f"(start_ts, id) < (${param_idx}::text::timestamptz, ${param_idx + 1})")
+        params.extend([str(last_start), last_id])
+        param_idx += 2
+
+        rows = await conn.fetch(
+            f"""
+            SELECT * FROM maintenance_windows
+            WHERE {" AND ".join(conditions)}
+            ORDER BY start_ts DESC, id DESC
+            LIMIT ${param_idx}
+            """,
+            *params, page_size + 1
+        )
+
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        return Response(
+            content=_WINDOW_PAGE(
+                items=_WINDOW_LIST.validate_python([dict(row) for row in rows]),
+                page=page,
+                page_size=page_size,
+                next_cursor=encode_cursor(rows[-1]["start_ts"], str(rows[-1]["id"])) if has_more else None,
+                has_more=has_more
+            ).model_dump_json(),
+            media_type="application/json"
+        )
 
-    total = await conn.fetchval(f"SELECT COUNT(*) FROM maintenance_windows WHERE {where_clause}", *params)
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
 
+    # The window count carries the total match count alongside the page
     offset = (page - 1) * page_size
-    query = f"""
-        SELECT * FROM maintenance_windows
+    rows = await conn.fetch(
+        f"""
+        SELECT *, COUNT(*) OVER () AS _total FROM maintenance_windows
         WHERE {where_clause}
-        ORDER BY start_ts DESC
+        ORDER BY start_ts DESC, id DESC
         LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """
-    params.extend([page_size, offset])
+        """,
+        *params, page_size, offset
+    )
 
-    rows = await conn.fetch(query, *params)
-    total_pages = (total + page_size - 1) // page_size
+    if rows:
+        total = rows[0]["_total"]
+    elif page > 1:
+        # Past the last page there is no row to carry the count
+        total = await conn.fetchval(
+            f"SELECT COUNT(*) FROM maintenance_windows WHERE {where_clause}", *params
+        )
+    else:
+        total = 0
 
-    return PaginatedResponse(
-        items=[MaintenanceWindowResponse(**dict(row)) for row in rows],
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages
+    total_pages = (total + page_size - 1) // page_size
+    has_more = page < total_pages
+
+    return Response(
+        content=_WINDOW_PAGE(
+            items=_WINDOW_LIST.validate_python([dict(row) for row in rows]),
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            next_cursor=encode_cursor(rows[-1]["start_ts"], str(rows[-1]["id"])) if has_more and rows else None,
+            has_more=has_more
+        ).model_dump_json(),
+        media_type="application/json"
     )
 
 
+@ttl_cache(ACTIVE_CACHE_TTL_SECONDS)
+async def _active_windows() -> bytes:
+    """Fetch currently active maintenance windows as an encoded JSON list."""
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT * FROM maintenance_windows
+            WHERE is_active = true AND start_ts <= NOW() AND end_ts >= NOW()
+            ORDER BY start_ts
+            """
+        )
+    return _WINDOW_LIST.dump_json(_WINDOW_LIST.validate_python([dict(row) for row in rows]))
+
+
 @router.get("/active", response_model=List[MaintenanceWindowResponse])
 async def get_active_maintenance_windows(
-    conn=Depends(get_db_connection),
     current_user: dict = Depends(get_current_user)
 ):
     """Get currently active maintenance windows."""
-    now = datetime.utcnow()
-    rows = await conn.fetch(
-        """
-        SELECT * FROM maintenance_windows
-        WHERE is_active = true AND start_ts <= $1 AND end_ts >= $1
-        ORDER BY start_ts
-        """,
-        now
-    )
-    return [MaintenanceWindowResponse(**dict(row)) for row in rows]
+    return Response(content=await _active_windows(), media_type="application/json")
 
 
 @router.get("/{window_id}", response_model=MaintenanceWindowDetail)
@@ -162,28 +233,33 @@ async def create_maintenance_window(
     current_user: dict = Depends(get_current_user)
 ):
     """Create a new maintenance window."""
-    if current_user["role"] not in ("operator", "admin"):
+    if current_user["role"] not in OPERATOR_ROLES:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
+    # The audit entry is written by the same statement
     window = await conn.fetchrow(
         """
-        INSERT INTO maintenance_windows (
-            source, title, description, start_ts, end_ts, timezone,
-            scope, suppress_mode, reason, created_by
+        WITH win AS (
+            INSERT INTO maintenance_windows (
+                source, title, description, start_ts, end_ts, timezone,
+                scope, suppress_mode, reason, created_by
+            )
+            VALUES ('manual', $1, $2, $3, $4, $5, $6, $7, $8, $9)
+            RETURNING *
+        ),
+        audit AS (
+            INSERT INTO audit_log (user_id, action, entity_type, entity_id, old_value, new_value)
+            SELECT $9, 'create', 'maintenance_window', win.id, NULL, to_jsonb(win)
+            FROM win
         )
-        VALUES ('manual', $1, $2, $3, $4, $5, $6, $7, $8, $9)
-        RETURNING *
+        SELECT * FROM win
         """,
         request.title, request.description, request.start_ts, request.end_ts,
-        request.timezone, request.scope.model_dump(), request.suppress_mode.value,
+        request.timezone, request.scope.model_dump(), request.suppress_mode,
         request.reason, current_user["id"]
     )
 
-    await log_audit(
-        conn, current_user["id"], "create", "maintenance_window", window["id"],
-        None, dict(window)
-    )
-
+    _active_windows.cache_clear()
     logger.info("Maintenance window created", window_id=str(window["id"]), by=current_user["username"])
 
     return MaintenanceWindowResponse(**dict(window))
@@ -197,55 +273,56 @@ async def update_maintenance_window(
     current_user: dict = Depends(get_current_user)
 ):
     """Update a maintenance window."""
-    if current_user["role"] not in ("operator", "admin"):
+    if current_user["role"] not in OPERATOR_ROLES:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    existing = await conn.fetchrow(
-        "SELECT * FROM maintenance_windows WHERE id = $1", window_id
-    )
-
-    if not existing:
-        raise HTTPException(status_code=404, detail="Maintenance window not found")
-
     # Build update query dynamically
     updates = []
     params = []
     param_idx = 1
 
-    update_data = request.model_dump(exclude_unset=True)
-
-    for field, value in update_data.items():
-        if field == "scope" and value is not None:
-            updates.append(f"scope = ${param_idx}")
-            params.append(value.model_dump() if hasattr(value, "model_dump") else value)
-        elif field == "suppress_mode" and value is not None:
-            updates.append(f"suppress_mode = ${param_idx}")
-            params.append(value.value if hasattr(value, "value") else value)
-        else:
-            updates.append(f"{field} = ${param_idx}")
-            params.append(value)
+    # model_dump() already flattens scope to a dict (encoded by the pool's
+    # jsonb codec) and SuppressMode is a str enum, so every field binds as-is
+    for field, value in request.model_dump(exclude_unset=True).items():
+        updates.append(f"{field} = ${param_idx}")
+        params.append(value)
         param_idx += 1
 
     if not updates:
+        existing = await conn.fetchrow(
+            "SELECT * FROM maintenance_windows WHERE id = $1", window_id
+        )
+        if not existing:
+            raise HTTPException(status_code=404, detail="Maintenance window not found")
         return MaintenanceWindowResponse(**dict(existing))
 
-    updates.append("updated_at = NOW()")
-    params.append(window_id)
-
+    # Lock the old row, update it and write the audit entry in one statement
     query = f"""
-        UPDATE maintenance_windows
-        SET {', '.join(updates)}
-        WHERE id = ${param_idx}
-        RETURNING *
+        WITH prev AS (
+            SELECT * FROM maintenance_windows WHERE id = ${param_idx} FOR UPDATE
+        ),
+        upd AS (
+            UPDATE maintenance_windows m
+            SET {', '.join(updates)}, updated_at = NOW()
+            FROM prev
+            WHERE m.id = prev.id
+            RETURNING m.*
+        ),
+        audit AS (
+            INSERT INTO audit_log (user_id, action, entity_type, entity_id, old_value, new_value)
+            SELECT ${param_idx + 1}, 'update', 'maintenance_window', upd.id,
+                   to_jsonb(prev), to_jsonb(upd)
+            FROM prev, upd
+        )
+        SELECT * FROM upd
     """
 
-    updated = await conn.fetchrow(query, *params)
+    updated = await conn.fetchrow(query, *params, window_id, current_user["id"])
 
-    await log_audit(
-        conn, current_user["id"], "update", "maintenance_window", window_id,
-        dict(existing), dict(updated)
-    )
+    if not updated:
+        raise HTTPException(status_code=404, detail="Maintenance window not found")
 
+    _active_windows.cache_clear()
     logger.info("Maintenance window updated", window_id=str(window_id), by=current_user["username"])
 
     return MaintenanceWindowResponse(**dict(updated))
@@ -261,20 +338,23 @@ async def delete_maintenance_window(
     if current_user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Only admins can delete maintenance windows")
 
-    existing = await conn.fetchrow(
-        "SELECT * FROM maintenance_windows WHERE id = $1", window_id
+    deleted_id = await conn.fetchval(
+        """
+        WITH del AS (
+            DELETE FROM maintenance_windows WHERE id = $1 RETURNING *
+        )
+        INSERT INTO audit_log (user_id, action, entity_type, entity_id, old_value, new_value)
+        SELECT $2, 'delete', 'maintenance_window', del.id, to_jsonb(del), NULL
+        FROM del
+        RETURNING entity_id
+        """,
+        window_id, current_user["id"]
     )
 
-    if not existing:
+    if not deleted_id:
         raise HTTPException(status_code=404, detail="Maintenance window not found")
 
-    await conn.execute("DELETE FROM maintenance_windows WHERE id = $1", window_id)
-
-    await log_audit(
-        conn, current_user["id"], "delete", "maintenance_window", window_id,
-        dict(existing), None
-    )
-
+    _active_windows.cache_clear()
     logger.info("Maintenance window deleted", window_id=str(window_id), by=current_user["username"])
 
 
@@ -285,20 +365,19 @@ async def get_maintenance_matches(
     current_user: dict = Depends(get_current_user)
 ):
     """Get match details for a maintenance window."""
-    exists = await conn.fetchval(
-        "SELECT 1 FROM maintenance_windows WHERE id = $1", window_id
-    )
-
-    if not exists:
-        raise HTTPException(status_code=404, detail="Maintenance window not found")
-
-    matches = await conn.fetch(
+    # NULL rather than an empty array means the window does not exist
+    payload = await conn.fetchval(
         """
-        SELECT * FROM maintenance_matches
-        WHERE maintenance_window_id = $1
-        ORDER BY matched_at DESC
+        SELECT CASE WHEN EXISTS (SELECT 1 FROM maintenance_windows WHERE id = $1) THEN (
+            SELECT COALESCE(json_agg(m ORDER BY m.matched_at DESC), '[]'::json)
+            FROM maintenance_matches m
+            WHERE m.maintenance_window_id = $1
+        ) END::text
         """,
         window_id
     )
 
-    return [MaintenanceMatchResponse(**dict(m)) for m in matches]
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Maintenance window not found")
+
+    return Response(content=payload, media_type="application/json")
@@ -1,6 +1,18 @@
 """Metrics router - Prometheus-compatible metrics."""
+import asyncio
+
+import structlog
 from prometheus_client import Counter, Gauge, Histogram
 
+from app.database import get_db_pool
+from app.schemas.common import IncidentStatus, SeverityLevel
+
+logger = structlog.get_logger()
+
+# How often the background task recomputes the state gauges; scrapes only
+# read the last values and never touch the database
+STATE_GAUGES_REFRESH_SECONDS = 15.0
+
 # Define Prometheus metrics
 INCIDENTS_TOTAL = Counter(
     "ngs_incidents_total",
@@ -8,10 +20,13 @@ INCIDENTS_TOTAL = Counter(
     ["severity", "source_tool"]
 )
 
+# State gauges are recomputed from the database by every worker's refresh
+# task, so in multiprocess mode the latest value wins instead of summing
 INCIDENTS_CURRENT = Gauge(
     "ngs_incidents_current",
     "Current incidents by status",
-    ["status", "severity"]
+    ["status", "severity"],
+    multiprocess_mode="livemostrecent"
 )
 
 EVENTS_PROCESSED = Counter(
@@ -28,7 +43,8 @@ EMAILS_INGESTED = Counter(
 
 MAINTENANCE_WINDOWS_ACTIVE = Gauge(
     "ngs_maintenance_windows_active",
-    "Currently active maintenance windows"
+    "Currently active maintenance windows",
+    multiprocess_mode="livemostrecent"
 )
 
 RAG_REQUESTS = Counter(
@@ -66,6 +82,48 @@ def set_incidents_gauge(status: str, severity: str, count: int):
     INCIDENTS_CURRENT.labels(status=status, severity=severity).set(count)
 
 
+async def refresh_state_gauges():
+    """Set the current incident and active maintenance gauges in one query."""
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(
+            """
+            SELECT
+                (
+                    SELECT COALESCE(json_agg(t), '[]'::json)
+                    FROM (
+                        SELECT status, severity, COUNT(*) AS count
+                        FROM incidents
+                        GROUP BY status, severity
+                    ) t
+                ) AS incidents,
+                (
+                    SELECT COUNT(*) FROM maintenance_windows
+                    WHERE is_active AND start_ts <= NOW() AND end_ts >= NOW()
+                ) AS active_windows
+            """
+        )
+
+    counts = {(r["status"], r["severity"]): r["count"] for r in row["incidents"]}
+    # Every combination is set so counts that drop to zero are reported as such
+    for status in IncidentStatus:
+        for severity in SeverityLevel:
+            count = counts.get((status.value, severity.value), 0)
+            set_incidents_gauge(status.value, severity.value, count)
+
+    set_maintenance_active(row["active_windows"])
+
+
+async def run_state_gauge_refresher():
+    """Refresh the state gauges until cancelled."""
+    while True:
+        try:
+            await refresh_state_gauges()
+        except Exception as e:
+            logger.warning("Failed to refresh state gauges", error=str(e))
+        await asyncio.sleep(STATE_GAUGES_REFRESH_SECONDS)
+
+
 def increment_events_processed(source_tool: str, parse_status: str):
     """Increment events processed counter."""
     EVENTS_PROCESSED.labels(source_tool=source_tool or "unknown", parse_status=parse_status).inc()
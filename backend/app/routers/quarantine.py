@@ -1,18 +1,34 @@
 """Quarantine router for parse failures."""
-from typing import List, Optional
+from functools import lru_cache
+from datetime import datetime
+from typing import List, Optional, Tuple, Union
 from uuid import UUID
 
+import orjson
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 
-from app.database import get_db_connection
-from app.routers.auth import get_current_user
-from app.schemas.common import PaginatedResponse
+from app.database import get_db_connection, get_db_pool
+from app.routers.auth import get_current_user, require_role
+from app.schemas.common import PaginatedResponse, UserRole
 from app.schemas.incidents import RawEmailResponse
+from app.services.cache import ttl_cache
+from app.services.pagination import decode_cursor, encode_cursor
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+require_operator = require_role([UserRole.OPERATOR, UserRole.ADMIN])
+require_admin = require_role([UserRole.ADMIN], detail="Only admins can delete emails")
+
+# Dashboards poll the stats far more often than quarantine changes
+STATS_CACHE_TTL_SECONDS = 10.0
+
+# Rows fetched per cursor round-trip when streaming
+STREAM_PREFETCH_ROWS = 200
+
 
 class QuarantinedEmail(RawEmailResponse):
     """Quarantined email with parse error info."""
@@ -20,88 +36,270 @@ class QuarantinedEmail(RawEmailResponse):
     parse_error: Optional[str] = None
 
 
-@router.get("/stats", response_model=dict)
-async def get_quarantine_stats(
-    conn=Depends(get_db_connection),
-    current_user: dict = Depends(get_current_user)
-):
-    """Get quarantine statistics."""
-    stats = await conn.fetch(
-        """
-        SELECT folder, COUNT(*) as count, MAX(received_at) as latest
-        FROM raw_emails
-        WHERE parse_status IN ('failed', 'quarantine')
-        GROUP BY folder
-        ORDER BY count DESC
-        """
-    )
+class QuarantinedEmailSummary(BaseModel):
+    """Quarantined email listing row without headers, bodies or attachments."""
+    id: UUID
+    folder: str
+    uid: int
+    message_id: Optional[str] = None
+    subject: Optional[str] = None
+    from_address: Optional[str] = None
+    received_at: datetime
+    parse_status: str
+    parse_error: Optional[str] = None
 
-    total = await conn.fetchval(
-        "SELECT COUNT(*) FROM raw_emails WHERE parse_status IN ('failed', 'quarantine')"
-    )
 
-    return {
-        "total": total,
-        "by_folder": [dict(s) for s in stats]
-    }
+# Serializes a single trusted row in the Rust core, skipping FastAPI's
+# response_model validation pass
+_QUARANTINED_EMAIL = TypeAdapter(QuarantinedEmail)
 
+# QuarantinedEmail fields. Rows are built with model_construct (no
+# validation), so nullable array/JSON columns are defaulted here instead.
+QUARANTINE_COLUMNS = """
+    id, folder, uid, message_id, subject, from_address,
+    COALESCE(to_addresses, '{}') AS to_addresses, date_header, headers,
+    body_text, body_html, COALESCE(attachments, '[]') AS attachments,
+    received_at, parse_status, parse_error
+"""
 
-@router.get("", response_model=PaginatedResponse[QuarantinedEmail])
-async def list_quarantined_emails(
-    folder: Optional[str] = Query(None),
-    search: Optional[str] = Query(None),
-    page: int = Query(1, ge=1),
-    page_size: int = Query(50, ge=1, le=200),
-    conn=Depends(get_db_connection),
-    current_user: dict = Depends(get_current_user)
-):
-    """List emails that failed parsing (quarantine)."""
+# QuarantinedEmailSummary fields: no headers, bodies or attachments, so
+# summary pages never touch their TOASTed values
+QUARANTINE_SUMMARY_COLUMNS = """
+    id, folder, uid, message_id, subject, from_address, received_at,
+    parse_status, parse_error
+"""
+
+
+@lru_cache(maxsize=4)
+def _quarantine_where(has_folder: bool, has_search: bool) -> Tuple[str, int]:
+    """Build the quarantine list WHERE clause for the given filters.
+
+    Returns the clause and the next free placeholder number.
+    """
     conditions = ["parse_status IN ('failed', 'quarantine')"]
-    params = []
     param_idx = 1
 
-    if folder:
+    if has_folder:
         conditions.append(f"folder = ${param_idx}")
-        params.append(folder)
         param_idx += 1
 
-    if search:
+    if has_search:
         conditions.append(f"(subject ILIKE ${param_idx} OR from_address ILIKE ${param_idx})")
-        params.append(f"%{search}%")
         param_idx += 1
 
-    where_clause = " AND ".join(conditions)
+    return " AND ".join(conditions), param_idx
 
-    total = await conn.fetchval(
-        f"SELECT COUNT(*) FROM raw_emails WHERE {where_clause}",
-        *params
-    )
 
-    offset = (page - 1) * page_size
-    rows = await conn.fetch(
-        f"""
-        SELECT id, folder, uid, message_id, subject, from_address, to_addresses,
-               date_header, headers, body_text, body_html, attachments, received_at,
-               parse_status, parse_error
+@lru_cache(maxsize=16)
+def _quarantine_list_sql(has_folder: bool, has_search: bool, keyset: bool, summary: bool) -> str:
+    """Build the quarantine list page query for one filter shape.
+
+    Filter values come first. In keyset mode the cursor's received_at and
+    id follow, then the limit; otherwise the limit and offset follow and
+    each row carries the total match count.
+    """
+    where_clause, param_idx = _quarantine_where(has_folder, has_search)
+    columns = QUARANTINE_SUMMARY_COLUMNS if summary else QUARANTINE_COLUMNS
+
+    if keyset:
+        return f"""
+            SELECT {columns}
+            FROM raw_emails
+            WHERE {where_clause}
+              AND (received_at, id) < (${param_idx}::text::timestamptz, ${param_idx + 1})
+            ORDER BY received_at DESC, id DESC
+            LIMIT ${param_idx + 2}
+            """
+
+    return f"""
+        SELECT {columns}, COUNT(*) OVER () AS _total
         FROM raw_emails
         WHERE {where_clause}
-        ORDER BY received_at DESC
+        ORDER BY received_at DESC, id DESC
         LIMIT ${param_idx} OFFSET ${param_idx + 1}
-        """,
+        """
+
+
+def _page_response(rows, **fields) -> Response:
+    """Encode a PaginatedResponse body straight from the rows with orjson.
+
+    The rows already have the QuarantinedEmail (or, for summary pages, the
+    QuarantinedEmailSummary) shape, so no model is built.
+    orjson encodes the datetimes natively; asyncpg's UUID type is not
+    supported by orjson, so ids go through the ``str`` fallback.
+    """
+    items = [dict(row) for row in rows]
+    for item in items:
+        item.pop("_total", None)
+
+    # Same key order and defaults as PaginatedResponse
+    payload = {
+        "items": items,
+        "total": None,
+        "page": None,
+        "page_size": None,
+        "total_pages": None,
+        "next_cursor": None,
+        "has_more": None,
+        **fields,
+    }
+    return Response(content=orjson.dumps(payload, default=str), media_type="application/json")
+
+
+def _ndjson_line(record) -> bytes:
+    """Encode one row as an NDJSON line, stringifying asyncpg UUIDs."""
+    return orjson.dumps(dict(record), default=str) + b"\n"
+
+
+@ttl_cache(STATS_CACHE_TTL_SECONDS)
+async def _quarantine_stats() -> str:
+    """Compute per-folder quarantine counts and their total as JSON."""
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        # Per-folder counts and their grand total from one scan, rendered
+        # to JSON by Postgres
+        return await conn.fetchval(
+            """
+            SELECT json_build_object(
+                'total', COALESCE(SUM(t.count), 0),
+                'by_folder', COALESCE(json_agg(t ORDER BY t.count DESC), '[]'::json)
+            )::text
+            FROM (
+                SELECT folder, COUNT(*) AS count, MAX(received_at) AS latest
+                FROM raw_emails
+                WHERE parse_status IN ('failed', 'quarantine')
+                GROUP BY folder
+            ) t
+            """
+        )
+
+
+# Static paths must stay registered above /{email_id}, which would otherwise
+# capture them and fail UUID validation
+@router.get("/stats", response_model=dict)
+async def get_quarantine_stats(
+    current_user: dict = Depends(get_current_user)
+):
+    """Get quarantine statistics."""
+    return Response(content=await _quarantine_stats(), media_type="application/json")
+
+
+@router.get(
+    "",
+    response_model=Union[PaginatedResponse[QuarantinedEmail], PaginatedResponse[QuarantinedEmailSummary]]
+)
+async def list_quarantined_emails(
+    folder: Optional[str] = Query(None),
+    search: Optional[str] = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    summary: bool = Query(False),
+    conn=Depends(get_db_connection),
+    current_user: dict = Depends(get_current_user)
+):
+    """List emails that failed parsing (quarantine).
+
+    Pass ``cursor`` (from a previous ``next_cursor``) for keyset pagination,
+    which skips the total count; ``page`` is ignored in that mode.
+
+    With ``summary`` the items are QuarantinedEmailSummary rows, which omit
+    headers, recipients, bodies and attachments to keep listing pages small.
+    """
+    params = [p for p in (folder, f"%{search}%" if search else None) if p]
+
+    if cursor is not None:
+        # Keyset pagination on (received_at, id); fetch one extra row to
+        # learn whether another page follows
+        last_received, last_id = decode_cursor(cursor, 2)
+        try:
+            last_id = UUID(last_id)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        rows = await conn.fetch(
+            _quarantine_list_sql(bool(folder), bool(search), True, summary),
+            *params, str(last_received), last_id, page_size + 1
+        )
+
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        return _page_response(
+            rows,
+            page=page,
+            page_size=page_size,
+            next_cursor=encode_cursor(rows[-1]["received_at"], str(rows[-1]["id"])) if has_more else None,
+            has_more=has_more
+        )
+
+    # The window count carries the total match count alongside the page
+    offset = (page - 1) * page_size
+    rows = await conn.fetch(
+        _quarantine_list_sql(bool(folder), bool(search), False, summary),
         *params, page_size, offset
     )
 
+    if rows:
+        total = rows[0]["_total"]
+    elif page > 1:
+        # Past the last page there is no row to carry the count
+        where_clause, _ = _quarantine_where(bool(folder), bool(search))
+        total = await conn.fetchval(
+            f"SELECT COUNT(*) FROM raw_emails WHERE {where_clause}",
+            *params
+        )
+    else:
+        total = 0
+
     total_pages = (total + page_size - 1) // page_size
+    has_more = page < total_pages
 
-    return PaginatedResponse(
-        items=[QuarantinedEmail(**dict(row)) for row in rows],
+    return _page_response(
+        rows,
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=(
+            encode_cursor(rows[-1]["received_at"], str(rows[-1]["id"])) if has_more and rows else None
+        ),
+        has_more=has_more
     )
 
 
+@router.get("/stream")
+async def stream_quarantined_emails(
+    folder: Optional[str] = Query(None),
+    search: Optional[str] = Query(None),
+    current_user: dict = Depends(get_current_user)
+):
+    """Stream all matching quarantined emails as NDJSON, newest first.
+
+    Rows are read through a server-side cursor and encoded one at a time,
+    so memory stays flat regardless of how many emails match. The
+    connection is held by the generator because the request's own
+    connection is released before the body is sent.
+    """
+    params = [p for p in (folder, f"%{search}%" if search else None) if p]
+    where_clause, _ = _quarantine_where(bool(folder), bool(search))
+    query = f"""
+        SELECT {QUARANTINE_COLUMNS}
+        FROM raw_emails
+        WHERE {where_clause}
+        ORDER BY received_at DESC, id DESC
+    """
+
+    async def rows():
+        pool = await get_db_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                async for record in conn.cursor(query, *params, prefetch=STREAM_PREFETCH_ROWS):
+                    yield _ndjson_line(record)
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+
 @router.get("/{email_id}", response_model=QuarantinedEmail)
 async def get_quarantined_email(
     email_id: UUID,
@@ -110,10 +308,8 @@ async def get_quarantined_email(
 ):
     """Get a specific quarantined email."""
     email = await conn.fetchrow(
-        """
-        SELECT id, folder, uid, message_id, subject, from_address, to_addresses,
-               date_header, headers, body_text, body_html, attachments, received_at,
-               parse_status, parse_error
+        f"""
+        SELECT {QUARANTINE_COLUMNS}
         FROM raw_emails
         WHERE id = $1 AND parse_status IN ('failed', 'quarantine')
         """,
@@ -123,31 +319,49 @@ async def get_quarantined_email(
     if not email:
         raise HTTPException(status_code=404, detail="Quarantined email not found")
 
-    return QuarantinedEmail(**dict(email))
+    return Response(
+        content=_QUARANTINED_EMAIL.dump_json(QuarantinedEmail.model_construct(**email)),
+        media_type="application/json"
+    )
 
 
 @router.post("/{email_id}/retry", status_code=202)
 async def retry_parse_email(
     email_id: UUID,
     conn=Depends(get_db_connection),
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(require_operator)
 ):
     """Mark a quarantined email for retry parsing."""
-    if current_user["role"] not in ("operator", "admin"):
-        raise HTTPException(status_code=403, detail="Insufficient permissions")
 
-    result = await conn.execute(
+    # Reset the email and write its audit entry in one statement
+    retried_id = await conn.fetchval(
         """
-        UPDATE raw_emails
-        SET parse_status = 'pending', parse_error = NULL
-        WHERE id = $1 AND parse_status IN ('failed', 'quarantine')
+        WITH prev AS (
+            SELECT id, parse_status, parse_error FROM raw_emails
+            WHERE id = $1 AND parse_status IN ('failed', 'quarantine')
+            FOR UPDATE
+        ),
+        upd AS (
+            UPDATE raw_emails r
+            SET parse_status = 'pending', parse_error = NULL
+            FROM prev
+            WHERE r.id = prev.id
+            RETURNING r.id
+        )
+        INSERT INTO audit_log (user_id, action, entity_type, entity_id, old_value, new_value)
+        SELECT $2, 'retry', 'raw_email', upd.id,
+               jsonb_build_object('parse_status', prev.parse_status, 'parse_error', prev.parse_error),
+               jsonb_build_object('parse_status', 'pending')
+        FROM prev JOIN upd ON upd.id = prev.id
+        RETURNING entity_id
         """,
-        email_id
+        email_id, current_user["id"]
     )
 
-    if result == "UPDATE 0":
+    if retried_id is None:
         raise HTTPException(status_code=404, detail="Quarantined email not found")
 
+    _quarantine_stats.cache_clear()
     logger.info("Email marked for retry", email_id=str(email_id), by=current_user["username"])
 
     return {"status": "queued", "message": "Email marked for retry parsing"}
@@ -157,21 +371,30 @@ async def retry_parse_email(
 async def delete_quarantined_email(
     email_id: UUID,
     conn=Depends(get_db_connection),
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(require_admin)
 ):
     """Delete a quarantined email (admin only)."""
-    if current_user["role"] != "admin":
-        raise HTTPException(status_code=403, detail="Only admins can delete emails")
 
-    result = await conn.execute(
+    # The audit entry keeps the identifying fields, not the message bodies
+    deleted_id = await conn.fetchval(
         """
-        DELETE FROM raw_emails
-        WHERE id = $1 AND parse_status IN ('failed', 'quarantine')
+        WITH del AS (
+            DELETE FROM raw_emails
+            WHERE id = $1 AND parse_status IN ('failed', 'quarantine')
+            RETURNING id, folder, uid, message_id, subject, from_address,
+                      parse_status, parse_error
+        )
+        INSERT INTO audit_log (user_id, action, entity_type, entity_id, old_value, new_value)
+        SELECT $2, 'delete', 'raw_email', del.id,
+               to_jsonb(del) - 'id', NULL
+        FROM del
+        RETURNING entity_id
         """,
-        email_id
+        email_id, current_user["id"]
     )
 
-    if result == "DELETE 0":
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Quarantined email not found")
 
+    _quarantine_stats.cache_clear()
     logger.info("Quarantined email deleted", email_id=str(email_id), by=current_user["username"])
@@ -55,12 +55,18 @@ T = TypeVar("T")
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Generic paginated response wrapper."""
+    """Generic paginated response wrapper.
+
+    With cursor pagination ``total`` and ``total_pages`` are not computed;
+    ``next_cursor`` fetches the following page while ``has_more`` is true.
+    """
     items: List[T]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    has_more: Optional[bool] = None
 
 
 class HealthResponse(BaseModel):
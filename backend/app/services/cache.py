@@ -0,0 +1,38 @@
+"""Short-lived in-process caching for read-heavy endpoints."""
+import asyncio
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+def ttl_cache(ttl: float):
+    """Cache an async function's result per argument tuple for ``ttl`` seconds.
+
+    Concurrent callers for the same arguments share a single in-flight call.
+    Failed calls are not cached.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        entries: Dict[Tuple, Tuple[float, asyncio.Future]] = {}
+
+        @wraps(func)
+        async def wrapper(*args):
+            now = time.monotonic()
+            entry = entries.get(args)
+            if entry is None or entry[0] <= now:
+                entry = (now + ttl, asyncio.ensure_future(func(*args)))
+                entries[args] = entry
+
+            future = entry[1]
+            try:
+                return await asyncio.shield(future)
+            finally:
+                failed = future.done() and (
+                    future.cancelled() or future.exception() is not None
+                )
+                if failed and entries.get(args) is entry:
+                    del entries[args]
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
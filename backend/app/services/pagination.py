@@ -0,0 +1,27 @@
+"""Keyset (cursor) pagination helpers."""
+import base64
+from typing import Any, List
+
+import orjson
+from fastapi import HTTPException
+
+
+def encode_cursor(*key: Any) -> str:
+    """Encode the sort key of a page's last row as an opaque cursor.
+
+    Pass row ids as ``str``: asyncpg returns its own UUID subclass, which
+    orjson refuses to encode.
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(key)).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decode a cursor into its sort key values, or raise 400."""
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        key = None
+
+    if not isinstance(key, list) or len(key) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key
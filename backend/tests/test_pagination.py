@@ -0,0 +1,28 @@
+"""Tests for keyset cursor encoding."""
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+from asyncpg.pgproto.pgproto import UUID as PgUUID
+from fastapi import HTTPException
+
+from app.services.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_asyncpg_uuid():
+    # Built the way the list endpoints build next_cursor from a fetched row
+    row_id = PgUUID("5f1c3a52-8d0e-4b7a-9c61-2f4e8a9b0d13")
+    last_seen = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    cursor = encode_cursor(last_seen, str(row_id))
+    last_value, last_id = decode_cursor(cursor, 2)
+
+    assert datetime.fromisoformat(last_value) == last_seen
+    assert UUID(last_id) == row_id
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor("only-one")])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, 2)
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,38 @@
+"""Tests for quarantine response encoding."""
+from datetime import datetime, timezone
+
+import orjson
+from asyncpg.pgproto.pgproto import UUID as PgUUID
+
+from app.routers.quarantine import _ndjson_line, _page_response
+
+ROW = {
+    "id": PgUUID("5f1c3a52-8d0e-4b7a-9c61-2f4e8a9b0d13"),
+    "folder": "INBOX",
+    "subject": "Disk full",
+    "received_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    "parse_status": "failed",
+    "_total": 1,
+}
+
+
+def test_page_response_encodes_asyncpg_rows():
+    response = _page_response([ROW], total=1, page=1)
+    body = orjson.loads(response.body)
+
+    assert body["items"] == [{
+        "id": "5f1c3a52-8d0e-4b7a-9c61-2f4e8a9b0d13",
+        "folder": "INBOX",
+        "subject": "Disk full",
+        "received_at": "2024-01-02T03:04:05+00:00",
+        "parse_status": "failed",
+    }]
+    assert body["total"] == 1
+    assert body["next_cursor"] is None
+
+
+def test_ndjson_line_encodes_asyncpg_rows():
+    line = _ndjson_line(ROW)
+
+    assert line.endswith(b"\n")
+    assert orjson.loads(line)["id"] == "5f1c3a52-8d0e-4b7a-9c61-2f4e8a9b0d13"
@@ -269,7 +269,7 @@ export default function IncidentsPage() {
         </div>
 
         {/* Pagination */}
-        {data && data.total_pages > 1 && (
+        {data && (data.total_pages ?? 0) > 1 && (
           <div className="bg-white px-4 py-3 flex items-center justify-between border-t border-gray-200 sm:px-6">
             <div className="flex-1 flex justify-between sm:hidden">
               <button
@@ -139,7 +139,7 @@ export default function QuarantinePage() {
         </table>
 
         {/* Pagination */}
-        {data && data.total_pages > 1 && (
+        {data && (data.total_pages ?? 0) > 1 && (
           <div className="bg-white px-4 py-3 flex items-center justify-between border-t border-gray-200">
             <div className="text-sm text-gray-700">
               Page {page} of {data.total_pages}
@@ -153,7 +153,7 @@ export default function QuarantinePage() {
                 Previous
               </button>
               <button
-                onClick={() => setPage((p) => Math.min(data.total_pages, p + 1))}
+                onClick={() => setPage((p) => Math.min(data.total_pages ?? p, p + 1))}
                 disabled={page === data.total_pages}
                 className="btn-secondary"
               >
@@ -117,8 +117,11 @@ export interface RawEmail {
 
 export interface PaginatedResponse<T> {
   items: T[]
-  total: number
+  // Not computed in cursor mode
+  total: number | null
   page: number
   page_size: number
-  total_pages: number
+  total_pages: number | null
+  next_cursor?: string | null
+  has_more?: boolean | null
 }
@@ -0,0 +1,13 @@
+-- ============================================================================
+-- Migration 004: Stats Indexes
+-- Covering indexes for the admin stats and ingestion status queries
+-- ============================================================================
+
+-- Per-folder parse status counts (ingestion status, stats overview).
+-- received_at is included so MAX(received_at) is answered from the index.
+CREATE INDEX IF NOT EXISTS idx_raw_emails_folder_status
+    ON raw_emails(folder, parse_status) INCLUDE (received_at);
+
+-- Incident status counts (stats overview)
+CREATE INDEX IF NOT EXISTS idx_incidents_status_maintenance
+    ON incidents(status) INCLUDE (is_in_maintenance);
@@ -0,0 +1,52 @@
+-- ============================================================================
+-- Migration 005: Incident Rollups
+-- Hourly pre-aggregations backing the admin timeline / MTTR / top-N stats.
+-- Refreshed periodically by the worker scheduler (REFRESH ... CONCURRENTLY).
+-- ============================================================================
+
+-- Incidents bucketed by creation hour
+CREATE MATERIALIZED VIEW IF NOT EXISTS incident_rollup_hourly AS
+SELECT
+    date_trunc('hour', created_at) AS bucket,
+    severity,
+    status,
+    source_tool,
+    host,
+    check_name,
+    service,
+    COALESCE(host, '(no host)') AS host_key,
+    COALESCE(check_name, service, '(unknown)') AS service_key,
+    COUNT(*) AS incident_count,
+    MAX(last_seen_at) AS last_seen_at
+FROM incidents
+GROUP BY 1, 2, 3, 4, 5, 6, 7;
+
+-- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_incident_rollup_hourly_key
+    ON incident_rollup_hourly(bucket, severity, status, source_tool, host, check_name, service)
+    NULLS NOT DISTINCT;
+
+-- Top hosts / top services group on the precomputed keys via index-only scans
+CREATE INDEX IF NOT EXISTS idx_incident_rollup_hourly_host
+    ON incident_rollup_hourly(bucket, host_key)
+    INCLUDE (incident_count, status, severity, last_seen_at);
+
+CREATE INDEX IF NOT EXISTS idx_incident_rollup_hourly_service
+    ON incident_rollup_hourly(bucket, service_key, source_tool)
+    INCLUDE (incident_count, status, host, last_seen_at);
+
+-- Resolved incidents bucketed by resolution hour
+CREATE MATERIALIZED VIEW IF NOT EXISTS incident_resolution_rollup_hourly AS
+SELECT
+    date_trunc('hour', resolved_at) AS bucket,
+    severity,
+    source_tool,
+    COUNT(*) AS resolved_count,
+    SUM(EXTRACT(EPOCH FROM (resolved_at - first_seen_at)) / 60) AS total_resolution_minutes
+FROM incidents
+WHERE resolved_at IS NOT NULL
+GROUP BY 1, 2, 3;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_incident_resolution_rollup_hourly_key
+    ON incident_resolution_rollup_hourly(bucket, severity, source_tool)
+    NULLS NOT DISTINCT;
@@ -0,0 +1,29 @@
+-- ============================================================================
+-- Migration 006: Incident Search
+-- Indexed text search for /admin/stats/search
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Word search over the searchable incident fields
+ALTER TABLE incidents ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple',
+            coalesce(title, '') || ' ' || coalesce(host, '') || ' ' ||
+            coalesce(check_name, '') || ' ' || coalesce(service, '') || ' ' ||
+            coalesce(fingerprint, ''))
+    ) STORED;
+
+-- Same fields as plain text, for substring (ILIKE) matches via trigrams
+ALTER TABLE incidents ADD COLUMN IF NOT EXISTS search_text text
+    GENERATED ALWAYS AS (
+        coalesce(title, '') || ' ' || coalesce(host, '') || ' ' ||
+        coalesce(check_name, '') || ' ' || coalesce(service, '') || ' ' ||
+        coalesce(fingerprint, '')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_incidents_search_tsv
+    ON incidents USING gin(search_tsv);
+
+CREATE INDEX IF NOT EXISTS idx_incidents_search_trgm
+    ON incidents USING gin(search_text gin_trgm_ops);
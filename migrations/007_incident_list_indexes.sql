@@ -0,0 +1,19 @@
+-- ============================================================================
+-- Migration 007: Incident List Indexes
+-- Covering indexes for the incident list and detail queries
+-- ============================================================================
+
+-- Status-filtered listing ordered by recency (the default dashboard view).
+-- The other common filters are included so they are checked from the index.
+CREATE INDEX IF NOT EXISTS idx_incidents_status_last_seen
+    ON incidents(status, last_seen_at DESC)
+    INCLUDE (severity, source_tool, environment, host, is_in_maintenance);
+
+-- Cheap range filtering on last_seen_at for unfiltered date-bounded listing
+CREATE INDEX IF NOT EXISTS idx_incidents_last_seen_brin
+    ON incidents USING BRIN (last_seen_at);
+
+-- Incident -> events join used by incident detail and event listing
+CREATE INDEX IF NOT EXISTS idx_incident_events_incident_covering
+    ON incident_events(incident_id)
+    INCLUDE (alert_event_id, is_deduplicated);
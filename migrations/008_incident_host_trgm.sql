@@ -0,0 +1,9 @@
+-- ============================================================================
+-- Migration 008: Incident Host Substring Index
+-- Trigram index for the list_incidents host filter (host ILIKE '%...%')
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_incidents_host_trgm
+    ON incidents USING gin(host gin_trgm_ops);
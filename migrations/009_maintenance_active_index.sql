@@ -0,0 +1,10 @@
+-- ============================================================================
+-- Migration 009: Active Maintenance Window Index
+-- Index for "active right now" lookups (is_active AND start_ts <= NOW()
+-- AND end_ts >= NOW()). NOW() cannot appear in an index predicate, so the
+-- partial index covers active windows and the range is checked on its keys.
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_maintenance_windows_active_range
+    ON maintenance_windows(end_ts, start_ts)
+    WHERE is_active = true;
@@ -0,0 +1,8 @@
+-- ============================================================================
+-- Migration 010: Quarantine Seek Index
+-- Keyset pagination for the quarantine list, newest first
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_raw_emails_quarantine_seek
+    ON raw_emails(received_at DESC, id DESC)
+    WHERE parse_status IN ('failed', 'quarantine');
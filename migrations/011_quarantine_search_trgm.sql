@@ -0,0 +1,15 @@
+-- ============================================================================
+-- Migration 011: Quarantine Search Indexes
+-- Trigram indexes for the quarantine list search (subject/from ILIKE '%...%')
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Partial, matching the list's parse_status filter, to keep them small
+CREATE INDEX IF NOT EXISTS idx_raw_emails_quarantine_subject_trgm
+    ON raw_emails USING gin(subject gin_trgm_ops)
+    WHERE parse_status IN ('failed', 'quarantine');
+
+CREATE INDEX IF NOT EXISTS idx_raw_emails_quarantine_from_trgm
+    ON raw_emails USING gin(from_address gin_trgm_ops)
+    WHERE parse_status IN ('failed', 'quarantine');
@@ -0,0 +1,11 @@
+-- ============================================================================
+-- Migration 012: Quarantine Folder Index
+-- Folder-filtered quarantine listing and the per-folder quarantine stats
+-- ============================================================================
+
+-- Sized by the quarantined rows only. Serves the folder-filtered list in
+-- (received_at, id) order and lets the stats GROUP BY folder / MAX(received_at)
+-- read from the index.
+CREATE INDEX IF NOT EXISTS idx_raw_emails_quarantine_folder
+    ON raw_emails(folder, received_at DESC, id DESC)
+    WHERE parse_status IN ('failed', 'quarantine');
@@ -0,0 +1,13 @@
+-- ============================================================================
+-- Migration 013: Incident Search Substring Indexes
+-- Trigram indexes for the list_incidents search filter, which matches
+-- title, host or check_name with ILIKE '%...%' (host is covered by 008)
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_incidents_title_trgm
+    ON incidents USING gin(title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_incidents_check_name_trgm
+    ON incidents USING gin(check_name gin_trgm_ops);
@@ -4,9 +4,11 @@ NGS RAG Mock Service
 A mock RAG (Retrieval Augmented Generation) service for local development.
 Simulates AI-powered incident enrichment without requiring actual LLM infrastructure.
 """
+import asyncio
+import os
 import random
-import time
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, Iterator, List, Optional
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
@@ -17,6 +19,9 @@ app = FastAPI(
     version="0.1.0"
 )
 
+# Opt-in artificial latency, for exercising client timeouts against the mock
+SIMULATE_LATENCY = os.environ.get("SIMULATE_LATENCY", "false").lower() in ("1", "true", "yes")
+
 # =============================================================================
 # Request/Response Models
 # =============================================================================
@@ -225,76 +230,113 @@ SAFE_ACTIONS = {
 }
 
 
+# Only the selected category's template is formatted per request
+SUMMARY_TEMPLATES = {
+    "cpu": "- {severity} CPU utilization detected on {host}\n- Check '{check}' triggered {count} times\n- May indicate runaway process or insufficient capacity",
+    "memory": "- {severity} memory pressure on {host}\n- Check '{check}' triggered {count} times\n- Possible memory leak or OOM condition",
+    "disk": "- {severity} disk space/IO issue on {host}\n- Check '{check}' triggered {count} times\n- Review disk usage and log rotation",
+    "network": "- {severity} network issue affecting {host}\n- Check '{check}' triggered {count} times\n- May be connectivity, DNS, or firewall related",
+    "database": "- {severity} database issue detected for {host}\n- Check '{check}' triggered {count} times\n- Review connection pools and query performance",
+    "application": "- {severity} application error on {host}\n- Check '{check}' triggered {count} times\n- Review application logs for root cause",
+    "default": "- {severity} alert on {host}\n- Check '{check}' triggered {count} times\n- Review system logs for details",
+}
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-def detect_category(incident: IncidentData, events: List[EventData]) -> str:
-    """Detect incident category from content."""
-    content = " ".join([
-        incident.title or "",
-        incident.check_name or "",
-        incident.service or "",
-        " ".join([e.subject or "" for e in events]),
-        " ".join([e.body_sample or "" for e in events]),
-    ]).lower()
-
-    if any(w in content for w in ["cpu", "load", "processor"]):
-        return "cpu"
-    if any(w in content for w in ["memory", "mem", "oom", "heap", "ram"]):
-        return "memory"
-    if any(w in content for w in ["disk", "storage", "filesystem", "inode", "space"]):
-        return "disk"
-    if any(w in content for w in ["network", "dns", "connectivity", "ping", "timeout", "connection"]):
-        return "network"
-    if any(w in content for w in ["database", "db", "mysql", "postgres", "redis", "mongo", "sql"]):
-        return "database"
-    if any(w in content for w in ["application", "app", "error", "exception", "500", "crash"]):
-        return "application"
-    if any(w in content for w in ["security", "auth", "ssl", "cert", "unauthorized"]):
-        return "security"
-
-    return "default"
+# Category keywords in priority order: when content matches several
+# categories, the earliest one listed wins
+CATEGORY_KEYWORDS = {
+    "cpu": ["cpu", "load", "processor"],
+    "memory": ["memory", "mem", "oom", "heap", "ram"],
+    "disk": ["disk", "storage", "filesystem", "inode", "space"],
+    "network": ["network", "dns", "connectivity", "ping", "timeout", "connection"],
+    "database": ["database", "db", "mysql", "postgres", "redis", "mongo", "sql"],
+    "application": ["application", "app", "error", "exception", "500", "crash"],
+    "security": ["security", "auth", "ssl", "cert", "unauthorized"],
+}
 
+# Keywords show up in subjects or early in a body; capping the text scanned
+# keeps detection cost bounded however large the incoming samples are
+BODY_SCAN_CHARS = 1024
+CONTENT_SCAN_CHARS = 8192
 
-def generate_summary(incident: IncidentData, category: str) -> str:
-    """Generate a summary for the incident."""
-    severity = incident.severity.upper()
-    host = incident.host or "multiple hosts"
-    check = incident.check_name or incident.service or "system check"
-
-    summaries = {
-        "cpu": f"- {severity} CPU utilization detected on {host}\n- Check '{check}' triggered {incident.event_count} times\n- May indicate runaway process or insufficient capacity",
-        "memory": f"- {severity} memory pressure on {host}\n- Check '{check}' triggered {incident.event_count} times\n- Possible memory leak or OOM condition",
-        "disk": f"- {severity} disk space/IO issue on {host}\n- Check '{check}' triggered {incident.event_count} times\n- Review disk usage and log rotation",
-        "network": f"- {severity} network issue affecting {host}\n- Check '{check}' triggered {incident.event_count} times\n- May be connectivity, DNS, or firewall related",
-        "database": f"- {severity} database issue detected for {host}\n- Check '{check}' triggered {incident.event_count} times\n- Review connection pools and query performance",
-        "application": f"- {severity} application error on {host}\n- Check '{check}' triggered {incident.event_count} times\n- Review application logs for root cause",
-    }
+_CATEGORY_RANK = {category: rank for rank, category in enumerate(CATEGORY_KEYWORDS)}
 
-    return summaries.get(category, f"- {severity} alert on {host}\n- Check '{check}' triggered {incident.event_count} times\n- Review system logs for details")
+# One pattern over every keyword, compiled once, with a named group per
+# category so a match reports its category directly. The lookahead reports
+# overlapping matches, and groups are ordered by priority so each position
+# yields its highest-priority category.
+_CATEGORY_RE = re.compile("(?=%s)" % "|".join(
+    f"(?P<{category}>{'|'.join(map(re.escape, sorted(words, key=len, reverse=True)))})"
+    for category, words in CATEGORY_KEYWORDS.items()
+))
 
 
-# =============================================================================
-# API Endpoints
-# =============================================================================
+def _content_parts(incident: IncidentData, events: List[EventData]) -> Iterator[str]:
+    """Yield the non-empty text fields scanned for category keywords."""
+    for text in (incident.title, incident.check_name, incident.service):
+        if text:
+            yield text
+    for event in events:
+        if event.subject:
+            yield event.subject
+    for event in events:
+        if event.body_sample:
+            yield event.body_sample[:BODY_SCAN_CHARS]
 
-@app.get("/healthz")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": "rag-mock"}
 
+def detect_category(incident: IncidentData, events: List[EventData]) -> str:
+    """Detect incident category from content."""
+    content = " ".join(_content_parts(incident, events))[:CONTENT_SCAN_CHARS].lower()
 
-@app.post("/enrich", response_model=EnrichmentResponse)
-async def enrich_incident(request: EnrichmentRequest):
-    """
-    Mock incident enrichment endpoint.
+    # A plain search() would return the leftmost keyword rather than the
+    # highest-priority one, so walk the matches, stopping on a top-priority hit
+    best = None
+    for match in _CATEGORY_RE.finditer(content):
+        if best is None or _CATEGORY_RANK[match.lastgroup] < _CATEGORY_RANK[best]:
+            best = match.lastgroup
+            if _CATEGORY_RANK[best] == 0:
+                break
 
-    Returns simulated AI-generated insights based on incident content.
-    """
-    # Simulate processing time
-    time.sleep(random.uniform(0.5, 2.0))
+    return best or "default"
 
+
+def generate_summary(incident: IncidentData, category: str) -> str:
+    """Generate a summary for the incident."""
+    template = SUMMARY_TEMPLATES.get(category, SUMMARY_TEMPLATES["default"])
+    return template.format(
+        severity=incident.severity.upper(),
+        host=incident.host or "multiple hosts",
+        check=incident.check_name or incident.service or "system check",
+        count=incident.event_count,
+    )
+
+
+def build_evidence(events: List[EventData]) -> List[Evidence]:
+    """Cite subjects and body samples from the first events."""
+    evidence = []
+    for event in events[:2]:
+        if event.subject:
+            evidence.append(Evidence(
+                source="email_subject",
+                snippet=event.subject[:200]
+            ))
+        if event.body_sample:
+            evidence.append(Evidence(
+                source="email_body",
+                snippet=event.body_sample[:200]
+            ))
+    return evidence
+
+
+def build_enrichment(request: EnrichmentRequest) -> EnrichmentResponse:
+    """Build the enrichment response for a request.
+
+    Every step is bounded in-memory work (detection scans at most
+    CONTENT_SCAN_CHARS), so it runs inline rather than in a thread pool.
+    """
     # Detect category
     category = detect_category(request.incident, request.events)
     category_name = CATEGORIES.get(category, "General")
@@ -306,20 +348,7 @@ async def enrich_incident(request: EnrichmentRequest):
     runbooks = RUNBOOKS.get(category, RUNBOOKS["default"])[:3]
     actions = SAFE_ACTIONS.get(category, SAFE_ACTIONS["default"])[:3]
 
-    # Generate evidence
-    evidence = []
-    if request.events:
-        for event in request.events[:2]:
-            if event.subject:
-                evidence.append(Evidence(
-                    source="email_subject",
-                    snippet=event.subject[:200]
-                ))
-            if event.body_sample:
-                evidence.append(Evidence(
-                    source="email_body",
-                    snippet=event.body_sample[:200]
-                ))
+    evidence = build_evidence(request.events)
 
     # Confidence based on data quality
     confidence = 0.7
@@ -339,7 +368,7 @@ async def enrich_incident(request: EnrichmentRequest):
         suggested_runbooks=runbooks,
         safe_actions=actions,
         confidence=round(confidence, 2),
-        evidence=evidence[:5],
+        evidence=evidence,
         labels={
             "auto_category": category,
             "severity_confirmed": request.incident.severity,
@@ -347,6 +376,30 @@ async def enrich_incident(request: EnrichmentRequest):
     )
 
 
+# =============================================================================
+# API Endpoints
+# =============================================================================
+
+@app.get("/healthz")
+async def health_check():
+    """Health check endpoint."""
+    return {"status": "healthy", "service": "rag-mock"}
+
+
+@app.post("/enrich", response_model=EnrichmentResponse)
+async def enrich_incident(request: EnrichmentRequest):
+    """
+    Mock incident enrichment endpoint.
+
+    Returns simulated AI-generated insights based on incident content.
+    """
+    # Simulate processing time without blocking other requests
+    if SIMULATE_LATENCY:
+        await asyncio.sleep(random.uniform(0.5, 2.0))
+
+    return build_enrichment(request)
+
+
 @app.get("/")
 async def root():
     """Root endpoint with service info."""
@@ -1,6 +1,7 @@
 """Worker configuration."""
-from functools import lru_cache
-from typing import List
+import re
+from functools import cached_property, lru_cache
+from typing import List, Pattern
 
 from pydantic_settings import BaseSettings
 
@@ -66,13 +67,24 @@ class WorkerSettings(BaseSettings):
         """Parse IMAP folders from comma-separated string."""
         return [f.strip() for f in self.imap_folders.split(",") if f.strip()]
 
-    @property
+    @cached_property
     def redaction_patterns_list(self) -> List[str]:
         """Parse redaction patterns."""
         if not self.redaction_patterns:
             return []
         return [p.strip() for p in self.redaction_patterns.split(",") if p.strip()]
 
+    @cached_property
+    def compiled_redaction_patterns(self) -> List[Pattern]:
+        """Compile redaction patterns once, skipping invalid ones."""
+        compiled = []
+        for pattern in self.redaction_patterns_list:
+            try:
+                compiled.append(re.compile(pattern, re.IGNORECASE))
+            except re.error:
+                pass
+        return compiled
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -7,6 +7,11 @@ from uuid import UUID
 import structlog
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 try:
     from icalendar import Calendar
 except ImportError:
@@ -43,7 +48,7 @@ class MaintenanceEngine:
         """Load maintenance detection configuration."""
         try:
             with open("/app/configs/maintenance.yml", "r") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
                 self.detection_patterns = config.get("detection", {})
             logger.info("Loaded maintenance config")
         except FileNotFoundError:
@@ -8,6 +8,11 @@ from uuid import UUID
 import structlog
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from worker.database import get_pool
 from worker.fingerprint import (
     compute_fingerprint_v2,
@@ -40,7 +45,7 @@ class EmailParser:
         # Then try to load and merge config file parsers
         try:
             with open("/app/configs/parsers.yml", "r") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
                 file_parsers = config.get("parsers", {})
                 # Merge file parsers on top of defaults (file takes priority for conflicts)
                 self.parsers.update(file_parsers)
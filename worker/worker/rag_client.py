@@ -13,6 +13,19 @@ from worker.database import get_pool
 
 logger = structlog.get_logger()
 
+# Default redactions, applied after any configured patterns
+DEFAULT_REDACTION_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"password[=:]\s*\S+",
+        r"api[_-]?key[=:]\s*\S+",
+        r"secret[=:]\s*\S+",
+        r"token[=:]\s*\S+",
+        r"bearer\s+\S+",
+        r"authorization[=:]\s*\S+",
+    )
+]
+
 
 class RAGClient:
     """Client for external RAG enrichment service."""
@@ -151,24 +164,11 @@ class RAGClient:
         if not text:
             return ""
 
-        for pattern in self.settings.redaction_patterns_list:
-            try:
-                text = re.sub(pattern, "[REDACTED]", text, flags=re.IGNORECASE)
-            except re.error:
-                pass
-
-        # Default redactions
-        default_patterns = [
-            r"password[=:]\s*\S+",
-            r"api[_-]?key[=:]\s*\S+",
-            r"secret[=:]\s*\S+",
-            r"token[=:]\s*\S+",
-            r"bearer\s+\S+",
-            r"authorization[=:]\s*\S+"
-        ]
+        for pattern in self.settings.compiled_redaction_patterns:
+            text = pattern.sub("[REDACTED]", text)
 
-        for pattern in default_patterns:
-            text = re.sub(pattern, "[REDACTED]", text, flags=re.IGNORECASE)
+        for pattern in DEFAULT_REDACTION_PATTERNS:
+            text = pattern.sub("[REDACTED]", text)
 
         return text
 
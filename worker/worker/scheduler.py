@@ -1,5 +1,6 @@
 """Scheduler for periodic worker tasks."""
 import asyncio
+import time
 from typing import Optional
 from uuid import UUID
 
@@ -13,6 +14,13 @@ from worker.rag_client import RAGClient
 
 logger = structlog.get_logger()
 
+# Materialized views backing the API's stats endpoints
+STATS_ROLLUP_VIEWS = (
+    "incident_rollup_hourly",
+    "incident_resolution_rollup_hourly",
+)
+STATS_ROLLUP_REFRESH_SECONDS = 300
+
 
 class Scheduler:
     """Runs periodic background tasks."""
@@ -28,6 +36,7 @@ class Scheduler:
         self.rag_client = rag_client
         self.parser = EmailParser()
         self.running = False
+        self._last_rollup_refresh = 0.0
 
     async def run(self):
         """Run the scheduler loop."""
@@ -78,6 +87,13 @@ class Scheduler:
             self.maintenance_engine.clear_expired_maintenance
         )
 
+        # Refresh stats rollups
+        if time.monotonic() - self._last_rollup_refresh >= STATS_ROLLUP_REFRESH_SECONDS:
+            await self._safe_run(
+                "stats_rollup_refresh",
+                self._refresh_stats_rollups
+            )
+
         # RAG enrichment for incidents
         if self.rag_client:
             await self._safe_run(
@@ -92,6 +108,17 @@ class Scheduler:
         except Exception as e:
             logger.error(f"Task {task_name} failed", error=str(e))
 
+    async def _refresh_stats_rollups(self):
+        """Refresh the incident rollup materialized views."""
+        pool = await get_pool()
+
+        async with pool.acquire() as conn:
+            for view in STATS_ROLLUP_VIEWS:
+                await conn.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}")
+
+        self._last_rollup_refresh = time.monotonic()
+        logger.debug("Refreshed stats rollups")
+
     async def _enrich_incidents(self):
         """Enrich incidents that need RAG processing."""
         incidents = await self.correlator.get_incidents_for_enrichment(limit=5)